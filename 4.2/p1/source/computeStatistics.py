@@ -5,11 +5,16 @@
 from __future__ import annotations
 
 import argparse
+import csv
 import math
+import os
 import sys
 import time
+from array import array
+from collections import Counter
+from itertools import compress, islice
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Dict, Iterable, List, Sequence, Tuple
 
 ROW_LABELS = [
     "COUNT",
@@ -21,41 +26,72 @@ ROW_LABELS = [
     "ELAPSED (s)",
 ]
 
+# Below this total input size, starting worker processes costs more than
+# the work they would share.
+PARALLEL_MIN_BYTES = 2 << 20
 
-def parse_numbers_from_file(file_path: Path) -> Tuple[List[float], List[str]]:
-    """Parse numbers from a text file, collecting any conversion errors."""
 
-    numbers: List[float] = []
+def parse_numbers_from_file(
+    file_path: Path,
+) -> Tuple[array[float], List[str]]:
+    """Parse numbers from a text file, collecting any conversion errors.
+
+    Values are stored in a packed ``array("d")`` (8 bytes per value) rather
+    than a list of boxed floats.
+    """
+
+    text = file_path.read_text(encoding="utf-8")
+    try:
+        # Fast path: split and convert the whole file in C.
+        return array("d", map(float, text.split())), []
+    except ValueError:
+        pass
+
+    # Slow path, only when the file holds invalid data: rescan by line so
+    # errors can report their line number.
+    numbers: array[float] = array("d")
     errors: List[str] = []
 
-    with file_path.open("r", encoding="utf-8") as file:
-        for line_no, line in enumerate(file, start=1):
-            for raw_item in line.strip().split():
-                if not raw_item:
-                    continue
-                try:
-                    numbers.append(float(raw_item))
-                except ValueError:
-                    message = (
-                        f"{file_path.name}: Invalid number at line {line_no}: "
-                        f"{raw_item}"
-                    )
-                    errors.append(message)
+    for line_no, line in enumerate(text.split("\n"), start=1):
+        raw_items = line.split()
+        try:
+            numbers.fromlist(list(map(float, raw_items)))
+            continue
+        except ValueError:
+            pass
+
+        for raw_item in raw_items:
+            try:
+                numbers.append(float(raw_item))
+            except ValueError:
+                message = (
+                    f"{file_path.name}: Invalid number at line {line_no}: "
+                    f"{raw_item}"
+                )
+                errors.append(message)
 
     return numbers, errors
 
 
-def compute_dataset_stats(values: List[float]) -> dict:
-    """Compute statistics for a single dataset."""
+def compute_dataset_stats(values: Sequence[float]) -> dict:
+    """Compute statistics for a single dataset.
+
+    The mean is the correctly rounded ``math.fsum`` of the raw values.
+    Variance and modes are derived from a frequency table, so repeated
+    values are folded in once with their counts.
+    """
 
     mean_value = compute_mean(values)
+    count = len(values)
+    frequency = Counter(values)
     median_value = compute_median(values)
-    modes = compute_mode(values)
-    variance_value = compute_variance(values, mean_value)
+    # All-distinct data has no mode; skip scanning the counts for a maximum.
+    modes = [] if len(frequency) == count else modes_from_frequency(frequency)
+    variance_value = compute_frequency_m2(frequency, mean_value) / count
     std_dev_value = math.sqrt(variance_value)
 
     return {
-        "count": len(values),
+        "count": count,
         "mean": mean_value,
         "median": median_value,
         "modes": modes,
@@ -67,62 +103,103 @@ def compute_dataset_stats(values: List[float]) -> dict:
 def compute_mean(values: Iterable[float]) -> float:
     """Return the arithmetic mean of the provided values."""
 
-    total = 0.0
-    count = 0
-    for value in values:
-        total += value
-        count += 1
-    if count == 0:
+    data = values if isinstance(values, Sequence) else list(values)
+    if not data:
         raise ValueError("Cannot compute mean of an empty sequence")
-    return total / count
+    # math.fsum reduces in C and keeps the sum correctly rounded.
+    return math.fsum(data) / len(data)
+
 
+def compute_frequency_m2(frequency: Dict[float, int], mean: float) -> float:
+    """Return the sum of squared deviations from a value table.
 
-def compute_median(values: List[float]) -> float:
+    Each distinct value contributes once, weighted by its repetition count.
+    """
+
+    return math.fsum(
+        repeats * (value - mean) ** 2
+        for value, repeats in frequency.items()
+    )
+
+
+def compute_median(values: Sequence[float]) -> float:
     """Return the median of the provided values."""
 
     if not values:
         raise ValueError("Cannot compute median of an empty sequence")
 
-    sorted_values = sorted(values)
-    mid = len(sorted_values) // 2
-    if len(sorted_values) % 2 == 0:
-        return (sorted_values[mid - 1] + sorted_values[mid]) / 2
-    return sorted_values[mid]
+    mid = len(values) // 2
+    upper = select_kth_smallest(values, mid)
+    if len(values) % 2 == 1:
+        return upper
+
+    # The lower middle is the largest value below the upper middle, unless
+    # the upper middle value itself also fills that position.
+    below = [value for value in values if value < upper]
+    lower = max(below) if len(below) == mid else upper
+    return (lower + upper) / 2
+
+
+def select_kth_smallest(values: Sequence[float], k: int) -> float:
+    """Return the k-th smallest value (0-based) using quickselect.
+
+    Falls back to a full sort when partitioning degrades, so the worst case
+    stays O(n log n) while the typical case is linear.
+    """
+
+    if not 0 <= k < len(values):
+        raise IndexError("k is out of range for the provided values")
+
+    items: Sequence[float] = values
+    depth_limit = 2 * max(len(values), 1).bit_length()
+    while len(items) > 1:
+        if depth_limit == 0:
+            return sorted(items)[k]
+        depth_limit -= 1
+
+        pivot = items[len(items) // 2]
+        lows = [value for value in items if value < pivot]
+        if k < len(lows):
+            items = lows
+            continue
+
+        highs = [value for value in items if value > pivot]
+        pivots_end = len(items) - len(highs)
+        if k < pivots_end:
+            return pivot
+        k -= pivots_end
+        items = highs
+    return items[0]
 
 
 def compute_mode(values: Iterable[float]) -> List[float]:
     """Return a list of modes, or an empty list when all frequencies are 1."""
 
-    frequency = {}
-    for value in values:
-        frequency[value] = frequency.get(value, 0) + 1
-
+    frequency = Counter(values)
     if not frequency:
         raise ValueError("Cannot compute mode of an empty sequence")
+    return modes_from_frequency(frequency)
+
+
+def modes_from_frequency(frequency: Dict[float, int]) -> List[float]:
+    """Return the most frequent values of a table, or [] if none repeat."""
 
     max_frequency = max(frequency.values())
     if max_frequency == 1:
         return []
-    # Multiple items can share the highest frequency.
-    return [
-        value
-        for value, count in frequency.items()
-        if count == max_frequency
-    ]
+    # Multiple items can share the highest frequency; select them with a
+    # C-level mask over the counts instead of a Python filter loop.
+    is_mode = map(max_frequency.__eq__, frequency.values())
+    return list(compress(frequency, is_mode))
 
 
 def compute_variance(values: Iterable[float], mean: float) -> float:
     """Return the population variance for the provided values and mean."""
 
-    total = 0.0
-    count = 0
-    for value in values:
-        diff = value - mean
-        total += diff * diff
-        count += 1
-    if count == 0:
+    frequency = Counter(values)
+    if not frequency:
         raise ValueError("Cannot compute variance of an empty sequence")
-    return total / count
+    return compute_frequency_m2(frequency, mean) / sum(frequency.values())
 
 
 def format_number(value: float) -> str:
@@ -141,7 +218,10 @@ def format_modes(modes: List[float]) -> str:
 def write_results(output_path: Path, results: List[str]) -> None:
     """Persist the computed results to the output file path."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text("\n".join(results) + "\n", encoding="utf-8")
+    # Stream the lines through one large buffer instead of joining them
+    # into a single string first.
+    with output_path.open("w", encoding="utf-8", buffering=1 << 20) as file:
+        file.writelines(f"{line}\n" for line in results)
 
 
 def pad_or_trim(values: List[str], expected: int) -> List[str]:
@@ -157,12 +237,13 @@ def pad_or_trim(values: List[str], expected: int) -> List[str]:
 def parse_table(lines: List[str]) -> dict:
     """Convert TSV lines into a label-to-values mapping."""
 
-    mapping = {}
-    for line in lines[1:]:
-        parts = line.split("\t")
-        if len(parts) >= 2:
-            mapping[parts[0]] = parts[1:]
-    return mapping
+    # csv's C reader splits every row; the header line is skipped lazily.
+    rows = csv.reader(
+        islice(lines, 1, None),
+        delimiter="\t",
+        quoting=csv.QUOTE_NONE,
+    )
+    return {row[0]: row[1:] for row in rows if len(row) >= 2}
 
 
 def merge_results(
@@ -174,9 +255,8 @@ def merge_results(
     if not existing_lines:
         return new_lines
 
-    existing_headers = existing_lines[0].split("\t")
-    existing_cols = len(existing_headers) - 1
-    new_cols = len(new_lines[0].split("\t")) - 1
+    existing_cols = existing_lines[0].count("\t")
+    new_cols = new_lines[0].count("\t")
 
     total_cols = existing_cols + new_cols
     headers = ["TC"] + [f"TC{i}" for i in range(1, total_cols + 1)]
@@ -186,20 +266,29 @@ def merge_results(
 
     merged_lines = ["\t".join(headers)]
 
+    # Each existing row is parsed once and the new run's cells are appended
+    # to it; rows only get padded when they are missing or malformed.
     for label in ROW_LABELS:
-        existing_vals = pad_or_trim(
-            existing_map.get(label, ["#N/A"] * existing_cols),
-            existing_cols,
-        )
-        new_vals = pad_or_trim(
-            new_map.get(label, ["#N/A"] * new_cols),
-            new_cols,
-        )
-        merged_lines.append("\t".join([label] + existing_vals + new_vals))
+        row = [label]
+        row += pad_or_trim(existing_map.get(label, []), existing_cols)
+        row += pad_or_trim(new_map.get(label, []), new_cols)
+        merged_lines.append("\t".join(row))
 
     return merged_lines
 
 
+# Per-dataset summary rows: (label, stats key, cell formatter), in the
+# order of ROW_LABELS. ELAPSED (s) is global and handled separately.
+SUMMARY_ROWS = (
+    ("COUNT", "count", str),
+    ("MEAN", "mean", format_number),
+    ("MEDIAN", "median", format_number),
+    ("MODE", "modes", format_modes),
+    ("SD", "std_dev", format_number),
+    ("VARIANCE", "variance", format_number),
+)
+
+
 def build_results_summary(
     datasets: List[dict | None],
     elapsed_seconds: float,
@@ -209,32 +298,20 @@ def build_results_summary(
     headers = ["TC"] + [f"TC{idx}" for idx in range(1, len(datasets) + 1)]
     lines = ["\t".join(headers)]
 
-    def format_row(label: str, extractor) -> str:
-        row = [label]
-        for stats in datasets:
-            if stats is None:
+    # Walk the datasets once, filling every row's cell for each column.
+    rows = [[label] for label, _, _ in SUMMARY_ROWS]
+    for stats in datasets:
+        if stats is None:
+            for row in rows:
                 row.append("#N/A")
-                continue
-            value = extractor(stats)
-            if label == "MODE":
-                row.append(format_modes(value))
-            elif label == "COUNT":
-                row.append(str(value))
-            else:
-                row.append(format_number(value))
-        return "\t".join(row)
-
-    lines.append(format_row("COUNT", lambda s: s["count"]))
-    lines.append(format_row("MEAN", lambda s: s["mean"]))
-    lines.append(format_row("MEDIAN", lambda s: s["median"]))
-    lines.append(format_row("MODE", lambda s: s["modes"]))
-    lines.append(format_row("SD", lambda s: s["std_dev"]))
-    lines.append(format_row("VARIANCE", lambda s: s["variance"]))
+            continue
+        for row, (_, key, formatter) in zip(rows, SUMMARY_ROWS):
+            row.append(formatter(stats[key]))
+    lines.extend("\t".join(row) for row in rows)
+
     # Elapsed time is global for the run; repeat for each column for clarity.
-    elapsed_row = ["ELAPSED (s)"] + [
-        format_number(elapsed_seconds)
-        for _ in datasets
-    ]
+    elapsed_text = format_number(elapsed_seconds)
+    elapsed_row = ["ELAPSED (s)"] + [elapsed_text] * len(datasets)
     lines.append("\t".join(elapsed_row))
 
     return lines
@@ -257,6 +334,33 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def use_worker_processes(paths: Sequence[Path]) -> bool:
+    """Return whether the inputs are large enough to pay for a pool."""
+    if len(paths) < 2 or (os.cpu_count() or 1) < 2:
+        return False
+    total_bytes = 0
+    for path in paths:
+        try:
+            total_bytes += path.stat().st_size
+        except OSError:
+            continue  # Reported later by process_data_file.
+    return total_bytes >= PARALLEL_MIN_BYTES
+
+
+def process_data_file(path: Path) -> Tuple[dict | None, List[str]]:
+    """Parse one input file and compute its stats, returning any errors."""
+
+    if not path.is_file():
+        return None, [f"Input file not found: {path}"]
+
+    numbers, errors = parse_numbers_from_file(path)
+    if not numbers:
+        errors.append(f"{path.name}: No valid numeric data found. Skipping.")
+        return None, errors
+
+    return compute_dataset_stats(numbers), errors
+
+
 def main() -> int:  # pylint: disable=too-many-locals
     """Entry point for the CLI tool."""
     args = parse_args()
@@ -265,24 +369,21 @@ def main() -> int:  # pylint: disable=too-many-locals
     datasets: List[dict | None] = []
     errors: List[str] = []
 
-    for path in args.data_files:
-        if not path.is_file():
-            errors.append(f"Input file not found: {path}")
-            datasets.append(None)
-            continue
+    # Files are independent, so large inputs are processed in parallel
+    # worker processes; results come back in the order given.
+    if use_worker_processes(args.data_files):
+        # Imported here: small runs skip the multiprocessing start-up.
+        # pylint: disable-next=import-outside-toplevel
+        from concurrent.futures import ProcessPoolExecutor
 
-        numbers, file_errors = parse_numbers_from_file(path)
-        errors.extend(file_errors)
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(process_data_file, args.data_files))
+    else:
+        results = [process_data_file(path) for path in args.data_files]
 
-        if not numbers:
-            errors.append(
-                f"{path.name}: No valid numeric data found. Skipping."
-            )
-            datasets.append(None)
-            continue
-
-        stats = compute_dataset_stats(numbers)
+    for stats, file_errors in results:
         datasets.append(stats)
+        errors.extend(file_errors)
 
     for error in errors:
         print(error, file=sys.stderr)
@@ -6,6 +6,7 @@ import math
 import sys
 import tempfile
 import unittest
+from array import array
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -16,12 +17,15 @@ from p1.source.computeStatistics import (  # type: ignore
     ROW_LABELS,
     build_results_summary,
     compute_dataset_stats,
+    compute_frequency_m2,
     compute_mean,
     compute_median,
     compute_mode,
     compute_variance,
     merge_results,
     parse_numbers_from_file,
+    select_kth_smallest,
+    use_worker_processes,
 )
 
 
@@ -40,6 +44,15 @@ class StatsFunctionsTest(unittest.TestCase):
         self.assertAlmostEqual(compute_median([1.0, 3.0, 2.0, 4.0]), 2.5)
         self.assertAlmostEqual(compute_median([5.0, 1.0, 3.0]), 3.0)
 
+    def test_median_with_duplicates_matches_sorted(self) -> None:
+        """Median via selection agrees with the sorted definition."""
+
+        values = [7.0, 2.0, 2.0, 9.0, 2.0, 5.0, 5.0, 1.0]
+        self.assertAlmostEqual(compute_median(values), 3.5)
+        self.assertAlmostEqual(compute_median([4.0, 4.0, 4.0, 1.0]), 4.0)
+        for k, expected in enumerate(sorted(values)):
+            self.assertEqual(select_kth_smallest(values, k), expected)
+
     def test_mode_multiple_and_none(self) -> None:
         """Mode returns all modes or empty when none."""
 
@@ -59,6 +72,23 @@ class StatsFunctionsTest(unittest.TestCase):
         self.assertAlmostEqual(variance, 2.0 / 3.0)
         self.assertAlmostEqual(math.sqrt(variance), math.sqrt(2.0 / 3.0))
 
+    def test_dataset_mean_correctly_rounded(self) -> None:
+        """Dataset mean is the correctly rounded fsum mean."""
+
+        values = array("d", [1e20, 1.0, -1e20, 3.0] * 3 + [2.5e5])
+        stats = compute_dataset_stats(values)
+        self.assertEqual(stats["count"], len(values))
+        self.assertEqual(stats["mean"], math.fsum(values) / len(values))
+
+    def test_frequency_m2_matches_expanded(self) -> None:
+        """Weighted pass over a value table equals the expanded pass."""
+
+        values = [2.0, 4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0]
+        frequency = {2.0: 1, 4.0: 3, 5.0: 2, 7.0: 1, 9.0: 1}
+        expected = math.fsum((value - 5.0) ** 2 for value in values)
+        self.assertAlmostEqual(compute_frequency_m2(frequency, 5.0), expected)
+        self.assertAlmostEqual(compute_variance(values, 5.0), 4.0)
+
     def test_parse_numbers_collects_errors(self) -> None:
         """Invalid tokens are reported while parsing numbers."""
 
@@ -66,7 +96,7 @@ class StatsFunctionsTest(unittest.TestCase):
             file_path = Path(tmpdir) / "data.txt"
             file_path.write_text("1 2 a\n3\n", encoding="utf-8")
             numbers, errors = parse_numbers_from_file(file_path)
-        self.assertEqual(numbers, [1.0, 2.0, 3.0])
+        self.assertEqual(numbers, array("d", [1.0, 2.0, 3.0]))
         self.assertEqual(len(errors), 1)
         self.assertIn("Invalid number at line 1", errors[0])
         self.assertIn("a", errors[0])
@@ -126,6 +156,11 @@ class StatsFunctionsTest(unittest.TestCase):
         # Ensure all expected labels are present.
         self.assertEqual(set(rows.keys()), set(ROW_LABELS))
 
+    def test_single_file_runs_inline(self) -> None:
+        """A single input file is never sent to a process pool."""
+
+        self.assertFalse(use_worker_processes([Path(__file__)]))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -7,33 +7,49 @@
 from __future__ import annotations
 
 import argparse
+import io
+import os
 import sys
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import List, Sequence, TextIO, Tuple
 
+# Con menos bytes de entrada en total, arrancar procesos cuesta más que el
+# trabajo que se reparte.
+MIN_BYTES_PARALELO = 2 << 20
 
-def leer_numeros_desde_archivo(ruta: Path) -> Tuple[List[str], List[str]]:
-    """Lee tokens desde un archivo, reportando datos inválidos."""
 
-    tokens: List[str] = []
-    errores: List[str] = []
+def leer_numeros_desde_archivo(
+    ruta: Path,
+) -> Tuple[List[str], List[int | None], List[str]]:
+    """Lee tokens y sus valores enteros, reportando datos inválidos.
+
+    Cada token inválido tiene ``None`` como valor.
+    """
 
-    with ruta.open("r", encoding="utf-8") as archivo:
-        for linea_idx, linea in enumerate(archivo, start=1):
-            for token in linea.strip().split():
-                if not token:
-                    continue
-                tokens.append(token)
-                try:
-                    int(token)
-                except ValueError:
-                    mensaje = (
-                        f"{ruta.name}: dato inválido en línea {linea_idx}: "
-                        f"{token}"
-                    )
-                    errores.append(mensaje)
+    texto = ruta.read_text(encoding="utf-8")
+    tokens = texto.split()
+    try:
+        # Camino rápido: se interpreta todo el archivo en un solo recorrido.
+        return tokens, list(map(int, tokens)), []
+    except ValueError:
+        pass
+
+    # Solo si hay datos inválidos se recorre por línea para reportarlos.
+    numeros: List[int | None] = []
+    errores: List[str] = []
+    for linea_idx, linea in enumerate(texto.split("\n"), start=1):
+        for token in linea.split():
+            try:
+                numeros.append(int(token))
+            except ValueError:
+                numeros.append(None)
+                mensaje = (
+                    f"{ruta.name}: dato inválido en línea {linea_idx}: "
+                    f"{token}"
+                )
+                errores.append(mensaje)
 
-    return tokens, errores
+    return tokens, numeros, errores
 
 
 def convertir_base(numero: int, base: int, simbolos: str) -> str:
@@ -56,6 +72,26 @@ def convertir_base(numero: int, base: int, simbolos: str) -> str:
     return signo + "".join(reversed(digitos))
 
 
+# Tablas de 256 entradas (una por byte) generadas con el algoritmo propio;
+# permiten convertir un byte completo por consulta en lugar de dígito por
+# dígito.
+BINARIO_POR_BYTE = tuple(
+    convertir_base(byte, 2, "01").rjust(8, "0") for byte in range(256)
+)
+HEXADECIMAL_POR_BYTE = tuple(
+    convertir_base(byte, 16, "0123456789ABCDEF").rjust(2, "0")
+    for byte in range(256)
+)
+
+
+def convertir_por_bytes(numero: int, tabla: Tuple[str, ...]) -> str:
+    """Convierte un entero no negativo concatenando la tabla de cada byte."""
+
+    cantidad_bytes = (numero.bit_length() + 7) // 8 or 1
+    octetos = numero.to_bytes(cantidad_bytes, "big")
+    return "".join(map(tabla.__getitem__, octetos)).lstrip("0") or "0"
+
+
 def a_binario(numero: int) -> str:
     """Convierte a binario estilo DEC2BIN (dos complementos para negativos)."""
 
@@ -63,7 +99,7 @@ def a_binario(numero: int) -> str:
         complemento_dos = (1 << 10) + numero
         return format(complemento_dos, "010b")
 
-    return convertir_base(numero, 2, "01")
+    return convertir_por_bytes(numero, BINARIO_POR_BYTE)
 
 
 def a_hexadecimal(numero: int) -> str:
@@ -76,31 +112,55 @@ def a_hexadecimal(numero: int) -> str:
         complemento_dos = (1 << 40) + numero
         return format(complemento_dos, "010X")
 
-    return convertir_base(numero, 16, "0123456789ABCDEF")
+    return convertir_por_bytes(numero, HEXADECIMAL_POR_BYTE)
 
 
-def construir_reporte_para_archivo(
+def escribir_reporte_para_archivo(
     nombre: str,
-    tokens: Iterable[str],
-) -> List[str]:
-    """Genera líneas de reporte con ITEM, valor y conversiones."""
+    tokens: Sequence[str],
+    salida: TextIO,
+    numeros: Sequence[int | None] | None = None,
+) -> None:
+    """Escribe en ``salida`` el reporte con ITEM, valor y conversiones.
 
-    encabezado = f"ITEM\t{Path(nombre).stem}\tBIN\tHEX"
-    lineas = [encabezado]
+    ``numeros`` puede traer los valores ya interpretados de ``tokens``.
+    """
 
-    for indice, token in enumerate(tokens, start=1):
-        try:
-            numero = int(token)
-        except ValueError:
-            binario = "#VALUE!"
-            hexadecimal = "#VALUE!"
-        else:
-            binario = a_binario(numero)
-            hexadecimal = a_hexadecimal(numero)
+    salida.write(f"ITEM\t{Path(nombre).stem}\tBIN\tHEX\n")
 
-        lineas.append(f"{indice}\t{token}\t{binario}\t{hexadecimal}")
+    if numeros is None:
+        interpretados: List[int | None] = []
+        for token in tokens:
+            try:
+                interpretados.append(int(token))
+            except ValueError:
+                interpretados.append(None)
+        numeros = interpretados
 
-    return lineas
+    # Cada valor distinto se convierte una sola vez para todo el lote: las
+    # columnas BIN y HEX se preformatean por valor y cada fila solo
+    # antepone su índice y token.
+    conversiones = {
+        numero: f"{a_binario(numero)}\t{a_hexadecimal(numero)}"
+        for numero in set(numeros)
+        if numero is not None
+    }
+    invalido = "#VALUE!\t#VALUE!"
+
+    for indice, (token, numero) in enumerate(zip(tokens, numeros), start=1):
+        conversion = conversiones.get(numero, invalido)
+        salida.write(f"{indice}\t{token}\t{conversion}\n")
+
+
+def construir_reporte_para_archivo(
+    nombre: str,
+    tokens: Sequence[str],
+) -> List[str]:
+    """Genera líneas de reporte con ITEM, valor y conversiones."""
+
+    buffer = io.StringIO()
+    escribir_reporte_para_archivo(nombre, tokens, buffer)
+    return buffer.getvalue().split("\n")[:-1]
 
 
 def parse_args() -> argparse.Namespace:
@@ -121,42 +181,77 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def usar_procesos(rutas: Sequence[Path]) -> bool:
+    """Indica si la entrada es lo bastante grande para usar procesos."""
+    if len(rutas) < 2 or (os.cpu_count() or 1) < 2:
+        return False
+    total_bytes = 0
+    for ruta in rutas:
+        try:
+            total_bytes += ruta.stat().st_size
+        except OSError:
+            continue  # Lo reporta después procesar_archivo.
+    return total_bytes >= MIN_BYTES_PARALELO
+
+
+def procesar_archivo(ruta: Path) -> Tuple[str, List[str]]:
+    """Procesa un archivo y devuelve (texto del bloque de reporte, errores).
+
+    El bloque se arma en un ``StringIO`` y viaja como un solo texto, sin
+    una lista intermedia de líneas.
+    """
+
+    if not ruta.is_file():
+        return "", [f"Archivo no encontrado: {ruta}"]
+
+    tokens, numeros, errores = leer_numeros_desde_archivo(ruta)
+    if not tokens:
+        errores.append(f"{ruta.name}: archivo vacío. Se omite.")
+        return "", errores
+
+    buffer = io.StringIO()
+    escribir_reporte_para_archivo(ruta.name, tokens, buffer, numeros)
+    return buffer.getvalue(), errores
+
+
 def main() -> int:
     """Punto de entrada del programa."""
 
     args = parse_args()
     errores: List[str] = []
-    bloques_reporte: List[str] = []
-    total_registros = 0
-
-    for ruta in args.data_files:
-        if not ruta.is_file():
-            errores.append(f"Archivo no encontrado: {ruta}")
-            continue
-
-        tokens, errores_archivo = leer_numeros_desde_archivo(ruta)
+    reporte = io.StringIO()
+
+    # Los archivos son independientes: si la entrada es grande se procesan
+    # en paralelo y los resultados regresan en el orden recibido.
+    rutas = args.data_files
+    if usar_procesos(rutas):
+        # Importado aquí: las corridas pequeñas no arrancan multiprocessing.
+        # pylint: disable-next=import-outside-toplevel
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor() as executor:
+            resultados = list(executor.map(procesar_archivo, rutas))
+    else:
+        resultados = [procesar_archivo(ruta) for ruta in rutas]
+
+    for bloque, errores_archivo in resultados:
         errores.extend(errores_archivo)
-
-        if not tokens:
-            errores.append(f"{ruta.name}: archivo vacío. Se omite.")
+        if not bloque:
             continue
-
-        bloque = construir_reporte_para_archivo(ruta.name, tokens)
-        bloques_reporte.extend(bloque)
-        bloques_reporte.append("")  # línea en blanco separadora
-        total_registros += len(tokens)
+        reporte.write(bloque)
+        reporte.write("\n")  # línea en blanco separadora
 
     for error in errores:
         print(error, file=sys.stderr)
 
-    if total_registros == 0:
+    texto_reporte = reporte.getvalue()
+    if not texto_reporte:
         mensaje = "No se procesaron datos. Nada que convertir."
         print(mensaje, file=sys.stderr)
         return 1
 
     # Imprime solo el resultado de la corrida actual.
-    for linea in bloques_reporte:
-        print(linea)
+    sys.stdout.write(texto_reporte)
 
     # Escribe el archivo de salida.
     resultado_path = (
@@ -165,10 +260,7 @@ def main() -> int:
         / "ConvertionResults.txt"
     )
     resultado_path.parent.mkdir(parents=True, exist_ok=True)
-    resultado_path.write_text(
-        "\n".join(bloques_reporte) + "\n",
-        encoding="utf-8",
-    )
+    resultado_path.write_text(texto_reporte, encoding="utf-8")
 
     return 0
 
@@ -12,11 +12,15 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from p2.source.convertNumbers import (  # type: ignore
+    BINARIO_POR_BYTE,
+    HEXADECIMAL_POR_BYTE,
     a_binario,
     a_hexadecimal,
     construir_reporte_para_archivo,
     convertir_base,
+    convertir_por_bytes,
     leer_numeros_desde_archivo,
+    usar_procesos,
 )
 
 
@@ -39,14 +43,28 @@ class ConvertNumbersTest(unittest.TestCase):
         self.assertEqual(a_binario(-39), "1111011001")
         self.assertEqual(a_hexadecimal(-39), "FFFFFFFFD9")
 
+    def test_convertir_por_bytes_coincide_con_convertir_base(self) -> None:
+        """Las tablas por byte dan el mismo resultado que el algoritmo."""
+
+        for numero in (0, 1, 255, 256, 4095, 65536, 2**40 + 7):
+            self.assertEqual(
+                convertir_por_bytes(numero, BINARIO_POR_BYTE),
+                convertir_base(numero, 2, "01"),
+            )
+            self.assertEqual(
+                convertir_por_bytes(numero, HEXADECIMAL_POR_BYTE),
+                convertir_base(numero, 16, "0123456789ABCDEF"),
+            )
+
     def test_leer_numeros_con_errores(self) -> None:
         """Lee números y reporta tokens inválidos sin detenerse."""
 
         with tempfile.TemporaryDirectory() as tmpdir:
             ruta = Path(tmpdir) / "datos.txt"
             ruta.write_text("1 2 x\n3\n", encoding="utf-8")
-            tokens, errores = leer_numeros_desde_archivo(ruta)
+            tokens, numeros, errores = leer_numeros_desde_archivo(ruta)
         self.assertEqual(tokens, ["1", "2", "x", "3"])
+        self.assertEqual(numeros, [1, 2, None, 3])
         self.assertEqual(len(errores), 1)
         self.assertIn("dato inválido", errores[0])
 
@@ -58,6 +76,14 @@ class ConvertNumbersTest(unittest.TestCase):
         self.assertEqual(lineas[1], "1\t2\t10\t2")
         self.assertEqual(lineas[2], "2\t10\t1010\tA")
 
+    def test_usar_procesos_archivos_chicos(self) -> None:
+        """Archivos chicos se procesan en el proceso principal."""
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ruta = Path(tmpdir) / "datos.txt"
+            ruta.write_text("1 2 3\n", encoding="utf-8")
+            self.assertFalse(usar_procesos([ruta, ruta]))
+
 
 if __name__ == "__main__":
     unittest.main()
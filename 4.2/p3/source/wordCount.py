@@ -5,67 +5,67 @@
 from __future__ import annotations
 
 import argparse
+import os
+import re
 import sys
 import time
+from collections import Counter
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+
+# Solo letras ASCII, guiones o apóstrofes, con al menos una letra.
+PATRON_PALABRA_VALIDA = re.compile(r"(?=[-']*[A-Za-z])[A-Za-z'-]+")
+# Se resuelve una sola vez, no por cada archivo procesado.
+DIRECTORIO_RESULTADOS = Path(__file__).resolve().parents[1] / "results"
+# Con menos bytes de entrada en total, arrancar procesos cuesta más que el
+# trabajo que se reparte.
+MIN_BYTES_PARALELO = 2 << 20
 
 
 def es_palabra_valida(token: str) -> bool:
     """Determina si un token es válido: letras, guiones o apóstrofes."""
 
-    if not token:
+    # Caminos rápidos en C: palabras solo de letras ASCII (el caso común) y
+    # tokens que no pueden ser válidos por no tener guion ni apóstrofe.
+    if token.isascii() and token.isalpha():
+        return True
+    if "-" not in token and "'" not in token:
         return False
-
-    tiene_letra = False
-    for caracter in token:
-        codigo = ord(caracter)
-        es_mayuscula = 65 <= codigo <= 90  # A-Z
-        es_minuscula = 97 <= codigo <= 122  # a-z
-        es_guion = caracter == "-"
-        es_apostrofe = caracter == "'"
-        if es_mayuscula or es_minuscula:
-            tiene_letra = True
-            continue
-        if not (es_guion or es_apostrofe):
-            return False
-
-    return tiene_letra
+    return PATRON_PALABRA_VALIDA.fullmatch(token) is not None
 
 
 def contar_palabras(tokens: Iterable[str]) -> Tuple[Dict[str, int], List[str]]:
     """Cuenta ocurrencias preservando orden de primera aparición."""
 
-    conteo: Dict[str, int] = {}
-    orden: List[str] = []
-    for palabra in tokens:
-        if palabra in conteo:
-            conteo[palabra] += 1
-        else:
-            conteo[palabra] = 1
-            orden.append(palabra)
+    # Counter cuenta en C y, como dict, conserva el orden de inserción.
+    conteo: Dict[str, int] = Counter(tokens)
+    orden: List[str] = list(conteo)
     return conteo, orden
 
 
 def leer_tokens(ruta: Path) -> Tuple[List[str], List[str]]:
     """Lee tokens desde archivo, devolviendo válidos y errores."""
 
+    texto = ruta.read_text(encoding="utf-8")
+    tokens = texto.split()
+    if all(map(es_palabra_valida, tokens)):
+        # Camino rápido: todo es ASCII válido, se normaliza de una vez.
+        return texto.lower().split(), []
+
+    # Solo si hay datos inválidos se recorre por línea para reportarlos.
     validos: List[str] = []
     errores: List[str] = []
-
-    with ruta.open("r", encoding="utf-8") as archivo:
-        for linea_idx, linea in enumerate(archivo, start=1):
-            for token in linea.strip().split():
-                if not token:
-                    continue
-                if es_palabra_valida(token):
-                    validos.append(token.lower())
-                else:
-                    mensaje = (
-                        f"{ruta.name}: dato inválido en línea {linea_idx}: "
-                        f"{token}"
-                    )
-                    errores.append(mensaje)
+    for linea_idx, linea in enumerate(texto.split("\n"), start=1):
+        for token in linea.split():
+            if es_palabra_valida(token):
+                validos.append(token.lower())
+            else:
+                mensaje = (
+                    f"{ruta.name}: dato inválido en línea {linea_idx}: "
+                    f"{token}"
+                )
+                errores.append(mensaje)
     return validos, errores
 
 
@@ -86,6 +86,14 @@ def construir_reporte(
     return lineas
 
 
+def escribir_lineas(ruta: Path, lineas: Iterable[str]) -> None:
+    """Escribe líneas en un archivo usando un solo buffer grande."""
+
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    with ruta.open("w", encoding="utf-8", buffering=1 << 20) as archivo:
+        archivo.writelines(f"{linea}\n" for linea in lineas)
+
+
 def parse_args() -> argparse.Namespace:
     """Parsea argumentos de línea de comandos."""
 
@@ -106,9 +114,25 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def usar_procesos(rutas: Sequence[Path]) -> bool:
+    """Indica si la entrada es lo bastante grande para usar procesos."""
+    if len(rutas) < 2 or (os.cpu_count() or 1) < 2:
+        return False
+    total_bytes = 0
+    for ruta in rutas:
+        try:
+            total_bytes += ruta.stat().st_size
+        except OSError:
+            continue  # Lo reporta después procesar_archivo.
+    return total_bytes >= MIN_BYTES_PARALELO
+
+
 def procesar_archivo(ruta: Path) -> Tuple[List[str], List[str]]:
     """Procesa un archivo y devuelve (reporte, errores)."""
 
+    if not ruta.is_file():
+        return [], [f"Archivo no encontrado: {ruta}"]
+
     tokens, errores = leer_tokens(ruta)
     if not tokens:
         errores.append(
@@ -130,12 +154,19 @@ def main() -> int:
     bloques: List[str] = []
     errores_totales: List[str] = []
 
-    for ruta in args.data_files:
-        if not ruta.is_file():
-            errores_totales.append(f"Archivo no encontrado: {ruta}")
-            continue
+    # Los archivos son independientes: si la entrada es grande se procesan
+    # en paralelo y los resultados regresan en el orden recibido.
+    if usar_procesos(args.data_files):
+        # Importado aquí: las corridas pequeñas no arrancan multiprocessing.
+        # pylint: disable-next=import-outside-toplevel
+        from concurrent.futures import ProcessPoolExecutor
 
-        reporte, errores = procesar_archivo(ruta)
+        with ProcessPoolExecutor() as executor:
+            resultados = list(executor.map(procesar_archivo, args.data_files))
+    else:
+        resultados = [procesar_archivo(ruta) for ruta in args.data_files]
+
+    for ruta, (reporte, errores) in zip(args.data_files, resultados):
         errores_totales.extend(errores)
 
         if not reporte:
@@ -145,15 +176,9 @@ def main() -> int:
         bloques.append("")
 
         # Archivo individual en results/<stem>.Results.txt
-        resultado_individual = (
-            Path(__file__).resolve().parents[1]
-            / "results"
-            / f"{ruta.stem}.Results.txt"
-        )
-        resultado_individual.parent.mkdir(parents=True, exist_ok=True)
-        resultado_individual.write_text(
-            "\n".join(reporte) + "\n",
-            encoding="utf-8",
+        escribir_lineas(
+            DIRECTORIO_RESULTADOS / f"{ruta.stem}.Results.txt",
+            reporte,
         )
 
     for error in errores_totales:
@@ -172,15 +197,7 @@ def main() -> int:
         print(linea)
 
     # Escribir reporte consolidado
-    salida_consolidada = (
-        Path(__file__).resolve().parents[1]
-        / "results"
-        / "WordCountResults.txt"
-    )
-    salida_consolidada.write_text(
-        "\n".join(bloques) + "\n",
-        encoding="utf-8",
-    )
+    escribir_lineas(DIRECTORIO_RESULTADOS / "WordCountResults.txt", bloques)
 
     return 0
 
@@ -16,6 +16,7 @@ from p3.source.wordCount import (  # type: ignore
     contar_palabras,
     es_palabra_valida,
     leer_tokens,
+    usar_procesos,
 )
 
 
@@ -64,6 +65,12 @@ class WordCountTest(unittest.TestCase):
         self.assertEqual(lineas[2], "mundo\t1")
         self.assertEqual(lineas[-1], "Grand Total\t3")
 
+    def test_usar_procesos_sin_archivos(self) -> None:
+        """Archivos inexistentes no cuentan para el umbral."""
+
+        faltantes = [Path("no_existe_1.txt"), Path("no_existe_2.txt")]
+        self.assertFalse(usar_procesos(faltantes))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import argparse
 import json
+import math
+import operator
+import sys
 import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 BASE_DIR = Path(__file__).resolve().parents[1]
 RESULT_FILE = BASE_DIR / "results" / "SalesResults.txt"
+SALE_LINE_TEMPLATE = "Sale #%04d: $%.2f"
 
 
 def parse_args() -> argparse.Namespace:
@@ -38,14 +42,25 @@ def print_error(message: str) -> None:
     print(f"ERROR: {message}")
 
 
-def load_json(file_path: Path) -> list[Any]:
-    """Load a JSON array from a file. Return an empty list on errors."""
+def read_input(file_path: Path) -> bytes | None:
+    """Read a whole input file as bytes. Return None if it is missing."""
     try:
-        with file_path.open("r", encoding="utf-8") as file:
-            data = json.load(file)
+        # One bulk read; json decodes the UTF-8 bytes itself, skipping the
+        # incremental text-mode reader.
+        return file_path.read_bytes()
     except FileNotFoundError:
+        return None
+
+
+def load_json(file_path: Path) -> list[Any]:
+    """Load a JSON array from a file. Return an empty list on errors."""
+    raw = read_input(file_path)
+    if raw is None:
         print_error(f"File not found: {file_path}")
         return []
+
+    try:
+        data = json.loads(raw)
     except json.JSONDecodeError as exc:
         print_error(f"Invalid JSON in {file_path}: {exc}")
         return []
@@ -69,13 +84,13 @@ def build_price_lookup(price_catalogue: list[Any]) -> dict[str, float]:
             )
             continue
 
+        # Only the two fields the lookup needs are read from each product.
         title = product.get("title")
-        price = product.get("price")
-
-        if not isinstance(title, str) or not title.strip():
+        if not isinstance(title, str) or not (clean_title := title.strip()):
             print_error(f"Catalogue row {index}: invalid or empty title")
             continue
 
+        price = product.get("price")
         try:
             price_value = float(price)
         except (TypeError, ValueError):
@@ -84,7 +99,7 @@ def build_price_lookup(price_catalogue: list[Any]) -> dict[str, float]:
             )
             continue
 
-        lookup[title.strip()] = price_value
+        lookup[clean_title] = price_value
 
     return lookup
 
@@ -109,83 +124,156 @@ def normalize_sale_items(
     return items
 
 
-def compute_item_cost(
-    item: Any,
-    lookup: dict[str, float],
+def parse_string_item(
+    item: str,
+    _sale_index: int,
+    _item_index: int,
+) -> tuple[str, int] | None:
+    """Parse a bare product title, which always means one unit."""
+    return item.strip(), 1
+
+
+def parse_object_item(
+    item: dict[str, Any],
     sale_index: int,
     item_index: int,
-) -> float:
-    """Compute cost for one sale item, returning 0.0 on invalid data."""
-    title = ""
-    quantity = 1
-
-    if isinstance(item, str):
-        title = item.strip()
-    elif isinstance(item, dict):
-        raw_title = item.get("title")
-        if not isinstance(raw_title, str) or not raw_title.strip():
-            print_error(
-                f"Sale {sale_index}, item {item_index}: invalid title"
-            )
-            return 0.0
-        title = raw_title.strip()
+) -> tuple[str, int] | None:
+    """Parse a {"title", "quantity"} item. Return None on invalid data."""
+    raw_title = item.get("title")
+    if not isinstance(raw_title, str) or not raw_title.strip():
+        print_error(f"Sale {sale_index}, item {item_index}: invalid title")
+        return None
+    title = raw_title.strip()
+
+    raw_quantity = item.get("quantity", 1)
+    try:
+        quantity = int(raw_quantity)
+    except (TypeError, ValueError):
+        print_error(
+            f"Sale {sale_index}, item {item_index}: invalid quantity "
+            f"for '{title}': {raw_quantity}"
+        )
+        return None
 
-        raw_quantity = item.get("quantity", 1)
-        try:
-            quantity = int(raw_quantity)
-        except (TypeError, ValueError):
-            print_error(
-                f"Sale {sale_index}, item {item_index}: invalid quantity "
-                f"for '{title}': {raw_quantity}"
-            )
-            return 0.0
+    if quantity < 0:
+        print_error(
+            f"Sale {sale_index}, item {item_index}: quantity cannot "
+            f"be negative for '{title}'"
+        )
+        return None
 
-        if quantity < 0:
-            print_error(
-                f"Sale {sale_index}, item {item_index}: quantity cannot "
-                f"be negative for '{title}'"
-            )
-            return 0.0
-    else:
+    return title, quantity
+
+
+# JSON only produces exact str/dict instances, so the item parser is
+# usually picked with one dict lookup on the type; subclasses such as
+# OrderedDict miss it and fall back to isinstance checks.
+ItemParser = Callable[[Any, int, int], "tuple[str, int] | None"]
+ITEM_PARSERS: dict[type, ItemParser] = {
+    str: parse_string_item,
+    dict: parse_object_item,
+}
+
+
+def resolve_sale_item(
+    item: Any,
+    lookup: dict[str, float],
+    sale_index: int,
+    item_index: int,
+) -> tuple[float, int] | None:
+    """Validate one sale item and return its (unit price, quantity).
+
+    Returns None, after reporting the problem, when the item is invalid.
+    """
+    parser = ITEM_PARSERS.get(type(item))
+    if parser is None:
+        parser = next(
+            (
+                candidate
+                for item_type, candidate in ITEM_PARSERS.items()
+                if isinstance(item, item_type)
+            ),
+            None,
+        )
+    if parser is None:
         print_error(
             f"Sale {sale_index}, item {item_index}: unsupported item type "
             f"{type(item).__name__}"
         )
-        return 0.0
+        return None
+
+    parsed = parser(item, sale_index, item_index)
+    if parsed is None:
+        return None
+    title, quantity = parsed
 
-    if title not in lookup:
+    price = lookup.get(title)
+    if price is None:
         print_error(
             f"Sale {sale_index}, item {item_index}: unknown product '{title}'"
         )
-        return 0.0
+        return None
 
-    return lookup[title] * quantity
+    return price, quantity
 
 
-def compute_sales_totals(
+def normalize_all_sales(
     sales_records: list[Any],
     lookup: dict[str, float],
-) -> tuple[list[float], float]:
-    """Compute per-sale totals and global total."""
-    sale_totals: list[float] = []
-    global_total = 0.0
+) -> tuple[list[float], list[int], list[int]]:
+    """Validate every sale item once into flat price/quantity columns.
+
+    Returns the unit prices and quantities of all valid items, plus
+    offsets such that sale ``n`` spans ``offsets[n]:offsets[n + 1]``.
+    Invalid rows are reported here, so later arithmetic needs no checks.
+    """
+    prices: list[float] = []
+    quantities: list[int] = []
+    offsets = [0]
 
     for sale_index, sale in enumerate(sales_records, start=1):
         items = normalize_sale_items(sale, sale_index)
-        sale_total = 0.0
-
         for item_index, item in enumerate(items, start=1):
-            sale_total += compute_item_cost(
-                item,
-                lookup,
-                sale_index,
-                item_index,
-            )
+            resolved = resolve_sale_item(item, lookup, sale_index, item_index)
+            if resolved is not None:
+                prices.append(resolved[0])
+                quantities.append(resolved[1])
+        offsets.append(len(prices))
+
+    return prices, quantities, offsets
 
-        sale_totals.append(sale_total)
-        global_total += sale_total
 
-    return sale_totals, global_total
+if hasattr(math, "sumprod"):
+
+    def multiply_sum(prices: list[float], quantities: list[int]) -> float:
+        """Return the sum of price * quantity pairs (math.sumprod)."""
+        # pylint: disable-next=no-member
+        return float(math.sumprod(prices, quantities))
+
+else:  # Python < 3.12
+
+    def multiply_sum(prices: list[float], quantities: list[int]) -> float:
+        """Return the sum of price * quantity pairs."""
+        return sum(map(operator.mul, prices, quantities), 0.0)
+
+
+def compute_sales_totals(
+    sales_records: list[Any],
+    lookup: dict[str, float],
+) -> tuple[list[float], float]:
+    """Compute per-sale totals and global total."""
+    prices, quantities, offsets = normalize_all_sales(sales_records, lookup)
+
+    # Each sale reduces its slice of the columns in one C-level
+    # multiply-sum; no validation is left in this loop. The comprehension
+    # is kept on purpose: filling a preallocated [0.0] * n by index, or an
+    # array("d"), measured slower, and the formatter needs floats anyway.
+    sale_totals = [
+        multiply_sum(prices[start:end], quantities[start:end])
+        for start, end in zip(offsets, offsets[1:])
+    ]
+
+    return sale_totals, sum(sale_totals, 0.0)
 
 
 def format_results(
@@ -194,13 +282,19 @@ def format_results(
     elapsed_seconds: float,
 ) -> str:
     """Build a human-readable result string."""
-    lines = ["Sales Summary", "=" * 40]
-    for index, value in enumerate(sale_totals, start=1):
-        lines.append(f"Sale #{index:04d}: ${value:.2f}")
-    lines.append("-" * 40)
-    lines.append(f"Grand Total: ${global_total:.2f}")
-    lines.append(f"Elapsed time: {elapsed_seconds:.6f} seconds")
-    return "\n".join(lines)
+    # enumerate already yields (index, total) tuples, so the %-template can
+    # be applied through map without a Python-level loop body.
+    sale_lines = map(SALE_LINE_TEMPLATE.__mod__, enumerate(sale_totals, 1))
+    return "\n".join(
+        (
+            "Sales Summary",
+            "=" * 40,
+            *sale_lines,
+            "-" * 40,
+            f"Grand Total: ${global_total:.2f}",
+            f"Elapsed time: {elapsed_seconds:.6f} seconds",
+        )
+    )
 
 
 def write_results(content: str, output_file: Path | None = None) -> None:
@@ -208,7 +302,8 @@ def write_results(content: str, output_file: Path | None = None) -> None:
     if output_file is None:
         output_file = RESULT_FILE
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    output_file.write_text(content + "\n", encoding="utf-8")
+    # Encode once and hand the OS a single bytes write.
+    output_file.write_bytes(f"{content}\n".encode("utf-8"))
 
 
 def main() -> int:
@@ -216,6 +311,12 @@ def main() -> int:
     start_time = time.perf_counter()
     args = parse_args()
 
+    # Block-buffer stdout so error reports and the summary are not flushed
+    # line by line when attached to a terminal.
+    reconfigure = getattr(sys.stdout, "reconfigure", None)
+    if reconfigure is not None:
+        reconfigure(line_buffering=False, write_through=False)
+
     price_catalogue = load_json(args.price_catalogue)
     sales_records = load_json(args.sales_record)
 
@@ -225,7 +326,8 @@ def main() -> int:
     elapsed_seconds = time.perf_counter() - start_time
     results_text = format_results(sale_totals, global_total, elapsed_seconds)
 
-    print(results_text)
+    sys.stdout.write(f"{results_text}\n")
+    sys.stdout.flush()
     write_results(results_text)
 
     return 0
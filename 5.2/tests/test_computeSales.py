@@ -5,6 +5,7 @@ from __future__ import annotations
 import importlib.util
 import json
 import sys
+from collections import OrderedDict
 from pathlib import Path
 
 
@@ -49,6 +50,45 @@ def test_compute_sales_totals_with_mixed_items() -> None:
     assert global_total == 10.5
 
 
+def test_item_subclasses_are_accepted() -> None:
+    """It prices dict and str subclasses like plain JSON values."""
+    compute_sales = load_module()
+
+    class Title(str):
+        """String subclass used as a bare product title."""
+
+    lookup = {"apple": 2.0}
+    sales = [
+        {"items": [OrderedDict(title="apple", quantity=2), Title("apple")]},
+    ]
+
+    sale_totals, _ = compute_sales.compute_sales_totals(sales, lookup)
+
+    assert sale_totals == [6.0]
+
+
+def test_normalize_all_sales_offsets(capsys) -> None:
+    """It flattens valid items and marks where each sale starts."""
+    compute_sales = load_module()
+
+    lookup = {"apple": 2.0, "pear": 4.0}
+    sales = [
+        {"items": ["apple", {"title": "pear", "quantity": 2}]},
+        "not a sale",
+        {"items": ["kiwi", {"title": "apple", "quantity": 5}]},
+    ]
+
+    prices, quantities, offsets = compute_sales.normalize_all_sales(
+        sales,
+        lookup,
+    )
+
+    assert prices == [2.0, 4.0, 2.0]
+    assert quantities == [1, 2, 5]
+    assert offsets == [0, 2, 2, 3]
+    assert "unknown product 'kiwi'" in capsys.readouterr().out
+
+
 def test_invalid_data_keeps_execution_and_reports_errors(capsys) -> None:
     """It skips invalid records and reports issues to console."""
     compute_sales = load_module()
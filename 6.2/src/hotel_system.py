@@ -2,15 +2,59 @@
 
 from __future__ import annotations
 
-import uuid
+import os
+from dataclasses import dataclass
+from itertools import chain
+from itertools import count
+from operator import attrgetter
 from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import TypeVar
 
 from .models import Customer
 from .models import Hotel
 from .models import Reservation
-from .storage import load_jsonl
+from .models import STATUS_ACTIVE
+from .models import STATUS_CANCELLED
+from .models import ValidationError
+from .storage import append_jsonl
+from .storage import iter_jsonl
 from .storage import save_jsonl
 
+Model = TypeVar("Model", Hotel, Customer, Reservation)
+
+DEFAULT_DATA_DIR = Path(__file__).resolve().parents[1] / "input"
+
+# Identificador de los modelos de cada archivo, por nombre de archivo.
+_ID_GETTERS: dict[str, Callable[[Any], str]] = {
+    "hotels.jsonl": attrgetter("hotel_id"),
+    "customers.jsonl": attrgetter("customer_id"),
+    "reservations.jsonl": attrgetter("reservation_id"),
+}
+# Campos que modify_* permite cambiar en cada entidad.
+_HOTEL_CHANGES = (
+    "name",
+    "location",
+    "amenities",
+    "total_rooms",
+    "available_rooms",
+)
+_CUSTOMER_CHANGES = ("full_name", "email", "phone")
+
+
+@dataclass
+class _CacheEntry:
+    """Modelos validados de un archivo y sus índices por identificador."""
+
+    signature: tuple[int, int] | None
+    models: list[Any]
+    by_id: dict[str, Any]
+    by_customer: dict[str, list[int]] | None = None
+    # Hoteles y clientes con al menos una reservación activa.
+    active_refs: tuple[set[str], set[str]] | None = None
+
 
 class HotelSystem:
     """Sistema de gestión con persistencia en archivos JSONL."""
@@ -18,60 +62,259 @@ class HotelSystem:
     def __init__(self, data_dir: Path | None = None) -> None:
         """Inicializa rutas de persistencia para entidades del sistema."""
         if data_dir is None:
-            data_dir = Path(__file__).resolve().parents[1] / "input"
+            data_dir = DEFAULT_DATA_DIR
         self.data_dir = data_dir
         self.hotels_file = data_dir / "hotels.jsonl"
         self.customers_file = data_dir / "customers.jsonl"
         self.reservations_file = data_dir / "reservations.jsonl"
+        # Modelos ya validados por archivo, junto con la firma
+        # (mtime, tamaño) del archivo con la que se cargaron.
+        self._cache: dict[Path, _CacheEntry] = {}
+        # Contador con base aleatoria: una sola lectura de entropía por
+        # instancia en lugar de un uuid4 por cada identificador.
+        self._id_counter = count(int.from_bytes(os.urandom(4), "big"))
+        # Archivos escritos desde el último sync(); se llevan a disco
+        # una sola vez al cerrar en lugar de en cada operación.
+        self._pending_sync: set[Path] = set()
+
+    def _generate_id(self, prefix: str, entry: _CacheEntry) -> str:
+        """Genera un identificador corto que no exista en ``entry``.
+
+        La base aleatoria puede caer dentro del rango de una corrida
+        anterior; los identificadores ya guardados se saltan.
+        """
+        while True:
+            candidate = f"{prefix}-{next(self._id_counter) & 0xFFFFFFFF:08x}"
+            if candidate not in entry.by_id:
+                return candidate
+
+    @staticmethod
+    def _file_signature(file_path: Path) -> tuple[int, int] | None:
+        """Devuelve (mtime, tamaño) del archivo, o None si no existe."""
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _build_entry(
+        self,
+        file_path: Path,
+        signature: tuple[int, int] | None,
+        models: list[Model],
+    ) -> _CacheEntry:
+        """Arma la entrada de caché indexando modelos por identificador."""
+        get_id = _ID_GETTERS[file_path.name]
+        by_id: dict[str, Model] = {}
+        for model in models:
+            # Ante identificadores repetidos gana el primero del archivo.
+            by_id.setdefault(get_id(model), model)
+        entry = _CacheEntry(signature, models, by_id)
+        if signature is None:
+            self._cache.pop(file_path, None)
+        else:
+            self._cache[file_path] = entry
+        return entry
+
+    def _load_entry(
+        self,
+        file_path: Path,
+        entity_name: str,
+        factory: Callable[[dict[str, Any]], Model],
+    ) -> _CacheEntry:
+        """Carga modelos validados, reutilizando la lectura previa.
+
+        El archivo solo se vuelve a leer y validar cuando su firma cambió
+        desde la última carga o escritura hecha por este sistema.
+        """
+        signature = self._file_signature(file_path)
+        cached = self._cache.get(file_path)
+        if cached is not None and cached.signature == signature:
+            return cached
+
+        # from_dict convierte y valida cada registro en un solo paso sobre
+        # el flujo de registros, sin una lista intermedia de diccionarios.
+        # Los registros inválidos se reportan juntos al terminar la carga.
+        models: list[Model] = []
+        errors: list[str] = []
+        for payload in iter_jsonl(file_path, entity_name):
+            try:
+                models.append(factory(payload))
+            except ValidationError as exc:
+                errors.append(f"ERROR: {exc}")
+        if errors:
+            print("\n".join(errors))
+        return self._build_entry(file_path, signature, models)
+
+    def _save_models(
+        self,
+        file_path: Path,
+        models: list[Model],
+    ) -> None:
+        """Persiste modelos y actualiza la caché con lo escrito."""
+        # Cada diccionario se arma justo antes de serializarse, sin una
+        # lista con todos los registros del archivo.
+        save_jsonl(file_path, (model.to_dict() for model in models))
+        self._pending_sync.add(file_path)
+        self._build_entry(
+            file_path,
+            self._file_signature(file_path),
+            list(models),
+        )
+
+    def _append_model(self, file_path: Path, model: Model) -> None:
+        """Agrega un modelo al archivo y a la caché sin reescribir nada."""
+        previous = self._file_signature(file_path)
+        append_jsonl(file_path, model.to_dict())
+        self._pending_sync.add(file_path)
+        entry = self._cache.get(file_path)
+        if entry is None or entry.signature != previous:
+            # La caché no reflejaba el archivo; se recarga cuando se pida.
+            self._invalidate(file_path)
+            return
+        # La caché guarda su propia copia, igual a la que daría releer el
+        # archivo: el modelo devuelto al llamador puede cambiar sin
+        # alterar la caché.
+        cached = type(model).from_dict(model.to_dict())
+        entry.models.append(cached)
+        get_id = _ID_GETTERS[file_path.name]
+        entry.by_id.setdefault(get_id(cached), cached)
+        entry.by_customer = None
+        entry.active_refs = None
+        entry.signature = self._file_signature(file_path)
+
+    @staticmethod
+    def _apply_changes(
+        model: Model,
+        changes: dict[str, object],
+        fields: tuple[str, ...],
+    ) -> Model | None:
+        """Devuelve una copia validada del modelo con los cambios aplicados.
+
+        El modelo en caché no se toca: si algún valor no se puede convertir
+        o no pasa la validación, se informa el error y se devuelve None.
+        """
+        payload = model.to_dict()
+        payload.update(
+            (field_name, changes[field_name])
+            for field_name in fields
+            if field_name in changes
+        )
+        return HotelSystem._build_model(type(model), payload)
+
+    @staticmethod
+    def _build_model(
+        model_type: type[Model],
+        payload: dict[str, object],
+    ) -> Model | None:
+        """Construye un modelo validado; informa el error y devuelve None."""
+        try:
+            return model_type.from_dict(payload)
+        except ValidationError as exc:
+            print(f"ERROR: {exc}")
+            return None
+
+    def sync(self) -> None:
+        """Lleva a disco los archivos escritos desde la última llamada."""
+        for file_path in sorted(self._pending_sync):
+            try:
+                # Con permiso de escritura: Windows lo exige para fsync.
+                with file_path.open("r+b") as file:
+                    os.fsync(file.fileno())
+            except FileNotFoundError:
+                continue
+        self._pending_sync.clear()
 
-    def _generate_id(self, prefix: str) -> str:
-        """Genera un identificador corto para las entidades."""
-        return f"{prefix}-{uuid.uuid4().hex[:8]}"
+    def _invalidate(self, file_path: Path) -> None:
+        """Descarta la caché de un archivo tras cambios no persistidos."""
+        self._cache.pop(file_path, None)
+
+    def _hotels_entry(self) -> _CacheEntry:
+        """Carga hoteles validados junto con su índice por id."""
+        return self._load_entry(self.hotels_file, "hoteles", Hotel.from_dict)
+
+    def _customers_entry(self) -> _CacheEntry:
+        """Carga clientes validados junto con su índice por id."""
+        return self._load_entry(
+            self.customers_file,
+            "clientes",
+            Customer.from_dict,
+        )
+
+    def _reservations_entry(self) -> _CacheEntry:
+        """Carga reservaciones validadas junto con su índice por id."""
+        return self._load_entry(
+            self.reservations_file,
+            "reservaciones",
+            Reservation.from_dict,
+        )
+
+    def _reservations_by_customer(
+        self,
+        customer_ids: Iterable[str],
+    ) -> list[Reservation]:
+        """Devuelve, en orden de archivo, las reservaciones de los clientes.
+
+        El índice cliente -> posiciones se arma una vez por carga del archivo.
+        """
+        entry = self._reservations_entry()
+        if entry.by_customer is None:
+            grouped: dict[str, list[int]] = {}
+            for position, reservation in enumerate(entry.models):
+                grouped.setdefault(reservation.customer_id, []).append(
+                    position
+                )
+            entry.by_customer = grouped
+        positions = sorted(
+            chain.from_iterable(
+                entry.by_customer.get(customer_id, ())
+                for customer_id in customer_ids
+            )
+        )
+        return [entry.models[position] for position in positions]
+
+    def _active_reservation_refs(self) -> tuple[set[str], set[str]]:
+        """Devuelve (hoteles, clientes) con reservaciones activas.
+
+        Se calcula una vez por carga del archivo de reservaciones, de modo
+        que las validaciones de borrado son búsquedas en conjuntos.
+        """
+        entry = self._reservations_entry()
+        if entry.active_refs is None:
+            active = [
+                reservation
+                for reservation in entry.models
+                if reservation.status == STATUS_ACTIVE
+            ]
+            entry.active_refs = (
+                {reservation.hotel_id for reservation in active},
+                {reservation.customer_id for reservation in active},
+            )
+        return entry.active_refs
 
     def _load_hotels(self) -> list[Hotel]:
         """Carga y valida hoteles almacenados."""
-        hotels: list[Hotel] = []
-        for payload in load_jsonl(self.hotels_file, "hoteles"):
-            hotel = Hotel.from_dict(payload)
-            if hotel is not None:
-                hotels.append(hotel)
-        return hotels
+        return list(self._hotels_entry().models)
 
     def _load_customers(self) -> list[Customer]:
         """Carga y valida clientes almacenados."""
-        customers: list[Customer] = []
-        for payload in load_jsonl(self.customers_file, "clientes"):
-            customer = Customer.from_dict(payload)
-            if customer is not None:
-                customers.append(customer)
-        return customers
+        return list(self._customers_entry().models)
 
     def _load_reservations(self) -> list[Reservation]:
         """Carga y valida reservaciones almacenadas."""
-        reservations: list[Reservation] = []
-        for payload in load_jsonl(self.reservations_file, "reservaciones"):
-            reservation = Reservation.from_dict(payload)
-            if reservation is not None:
-                reservations.append(reservation)
-        return reservations
+        return list(self._reservations_entry().models)
 
     def _save_hotels(self, hotels: list[Hotel]) -> None:
         """Persiste lista de hoteles."""
-        save_jsonl(self.hotels_file, [hotel.to_dict() for hotel in hotels])
+        self._save_models(self.hotels_file, hotels)
 
     def _save_customers(self, customers: list[Customer]) -> None:
         """Persiste lista de clientes."""
-        save_jsonl(
-            self.customers_file,
-            [customer.to_dict() for customer in customers],
-        )
+        self._save_models(self.customers_file, customers)
 
     def _save_reservations(self, reservations: list[Reservation]) -> None:
         """Persiste lista de reservaciones."""
-        save_jsonl(
-            self.reservations_file,
-            [reservation.to_dict() for reservation in reservations],
-        )
+        self._save_models(self.reservations_file, reservations)
 
     def create_hotel(
         self,
@@ -81,43 +324,41 @@ class HotelSystem:
         amenities: list[str] | None = None,
     ) -> Hotel | None:
         """Crea un hotel nuevo y lo persiste."""
-        hotel = Hotel(
-            hotel_id=self._generate_id("HOT"),
-            name=name,
-            location=location,
-            total_rooms=total_rooms,
-            available_rooms=total_rooms,
-            amenities=amenities or [],
+        # from_dict convierte los tipos (por ejemplo "5" o 5.0 a 5) y
+        # valida; un valor no convertible se informa como error.
+        hotel = self._build_model(
+            Hotel,
+            {
+                "hotel_id": self._generate_id("HOT", self._hotels_entry()),
+                "name": name,
+                "location": location,
+                "total_rooms": total_rooms,
+                "available_rooms": total_rooms,
+                "amenities": list(amenities or []),
+            },
         )
-        validated = Hotel.from_dict(hotel.to_dict())
-        if validated is None:
+        if hotel is None:
             return None
 
-        hotels = self._load_hotels()
-        hotels.append(validated)
-        self._save_hotels(hotels)
-        return validated
+        self._append_model(self.hotels_file, hotel)
+        return hotel
 
     def delete_hotel(self, hotel_id: str) -> bool:
         """Elimina un hotel si no tiene reservaciones activas."""
-        reservations = self._load_reservations()
-        for reservation in reservations:
-            if (
-                reservation.hotel_id == hotel_id
-                and reservation.status == "active"
-            ):
-                print(
-                    "ERROR: no se puede eliminar hotel con "
-                    "reservaciones activas"
-                )
-                return False
+        if hotel_id in self._active_reservation_refs()[0]:
+            print(
+                "ERROR: no se puede eliminar hotel con reservaciones activas"
+            )
+            return False
 
-        hotels = self._load_hotels()
-        remaining = [hotel for hotel in hotels if hotel.hotel_id != hotel_id]
-        if len(remaining) == len(hotels):
+        entry = self._hotels_entry()
+        if hotel_id not in entry.by_id:
             print(f"ERROR: hotel no encontrado: {hotel_id}")
             return False
 
+        remaining = [
+            hotel for hotel in entry.models if hotel.hotel_id != hotel_id
+        ]
         self._save_hotels(remaining)
         return True
 
@@ -126,11 +367,11 @@ class HotelSystem:
         hotel_id: str,
     ) -> dict[str, object] | None:
         """Devuelve información de un hotel por identificador."""
-        for hotel in self._load_hotels():
-            if hotel.hotel_id == hotel_id:
-                return hotel.to_dict()
-        print(f"ERROR: hotel no encontrado: {hotel_id}")
-        return None
+        hotel = self._hotels_entry().by_id.get(hotel_id)
+        if hotel is None:
+            print(f"ERROR: hotel no encontrado: {hotel_id}")
+            return None
+        return hotel.to_dict()
 
     def modify_hotel_information(
         self,
@@ -138,31 +379,24 @@ class HotelSystem:
         **changes: object,
     ) -> bool:
         """Actualiza datos de un hotel existente."""
-        hotels = self._load_hotels()
-        for hotel in hotels:
-            if hotel.hotel_id != hotel_id:
-                continue
-
-            if "name" in changes:
-                hotel.name = str(changes["name"])
-            if "location" in changes:
-                hotel.location = str(changes["location"])
-            if "amenities" in changes:
-                hotel.amenities = list(changes["amenities"])
-            if "total_rooms" in changes:
-                hotel.total_rooms = int(changes["total_rooms"])
-            if "available_rooms" in changes:
-                hotel.available_rooms = int(changes["available_rooms"])
-
-            validated = Hotel.from_dict(hotel.to_dict())
-            if validated is None:
-                return False
+        entry = self._hotels_entry()
+        hotel = entry.by_id.get(hotel_id)
+        if hotel is None:
+            print(f"ERROR: hotel no encontrado: {hotel_id}")
+            return False
 
-            self._save_hotels(hotels)
-            return True
+        updated = self._apply_changes(
+            hotel,
+            changes,
+            _HOTEL_CHANGES,
+        )
+        if updated is None:
+            return False
 
-        print(f"ERROR: hotel no encontrado: {hotel_id}")
-        return False
+        self._save_hotels(
+            [updated if model is hotel else model for model in entry.models]
+        )
+        return True
 
     def create_customer(
         self,
@@ -171,45 +405,43 @@ class HotelSystem:
         phone: str,
     ) -> Customer | None:
         """Crea un cliente nuevo y lo persiste."""
-        customer = Customer(
-            customer_id=self._generate_id("CUS"),
-            full_name=full_name,
-            email=email,
-            phone=phone,
+        customer = self._build_model(
+            Customer,
+            {
+                "customer_id": self._generate_id(
+                    "CUS",
+                    self._customers_entry(),
+                ),
+                "full_name": full_name,
+                "email": email,
+                "phone": phone,
+            },
         )
-        validated = Customer.from_dict(customer.to_dict())
-        if validated is None:
+        if customer is None:
             return None
 
-        customers = self._load_customers()
-        customers.append(validated)
-        self._save_customers(customers)
-        return validated
+        self._append_model(self.customers_file, customer)
+        return customer
 
     def delete_customer(self, customer_id: str) -> bool:
         """Elimina un cliente si no tiene reservaciones activas."""
-        reservations = self._load_reservations()
-        for reservation in reservations:
-            if (
-                reservation.customer_id == customer_id
-                and reservation.status == "active"
-            ):
-                print(
-                    "ERROR: no se puede eliminar cliente con "
-                    "reservaciones activas"
-                )
-                return False
+        if customer_id in self._active_reservation_refs()[1]:
+            print(
+                "ERROR: no se puede eliminar cliente con "
+                "reservaciones activas"
+            )
+            return False
+
+        entry = self._customers_entry()
+        if customer_id not in entry.by_id:
+            print(f"ERROR: cliente no encontrado: {customer_id}")
+            return False
 
-        customers = self._load_customers()
         remaining = [
             customer
-            for customer in customers
+            for customer in entry.models
             if customer.customer_id != customer_id
         ]
-        if len(remaining) == len(customers):
-            print(f"ERROR: cliente no encontrado: {customer_id}")
-            return False
-
         self._save_customers(remaining)
         return True
 
@@ -218,11 +450,11 @@ class HotelSystem:
         customer_id: str,
     ) -> dict[str, str] | None:
         """Devuelve información de un cliente por identificador."""
-        for customer in self._load_customers():
-            if customer.customer_id == customer_id:
-                return customer.to_dict()
-        print(f"ERROR: cliente no encontrado: {customer_id}")
-        return None
+        customer = self._customers_entry().by_id.get(customer_id)
+        if customer is None:
+            print(f"ERROR: cliente no encontrado: {customer_id}")
+            return None
+        return customer.to_dict()
 
     def modify_customer_information(
         self,
@@ -230,27 +462,24 @@ class HotelSystem:
         **changes: object,
     ) -> bool:
         """Actualiza datos de un cliente existente."""
-        customers = self._load_customers()
-        for customer in customers:
-            if customer.customer_id != customer_id:
-                continue
-
-            if "full_name" in changes:
-                customer.full_name = str(changes["full_name"])
-            if "email" in changes:
-                customer.email = str(changes["email"])
-            if "phone" in changes:
-                customer.phone = str(changes["phone"])
-
-            validated = Customer.from_dict(customer.to_dict())
-            if validated is None:
-                return False
+        entry = self._customers_entry()
+        customer = entry.by_id.get(customer_id)
+        if customer is None:
+            print(f"ERROR: cliente no encontrado: {customer_id}")
+            return False
 
-            self._save_customers(customers)
-            return True
+        updated = self._apply_changes(
+            customer,
+            changes,
+            _CUSTOMER_CHANGES,
+        )
+        if updated is None:
+            return False
 
-        print(f"ERROR: cliente no encontrado: {customer_id}")
-        return False
+        self._save_customers(
+            [updated if model is customer else model for model in entry.models]
+        )
+        return True
 
     def reserve_room(
         self,
@@ -268,86 +497,58 @@ class HotelSystem:
         room_count: int = 1,
     ) -> Reservation | None:
         """Crea una reservación validando existencia y disponibilidad."""
-        if room_count <= 0:
-            print("ERROR: la cantidad de cuartos debe ser mayor a cero")
+        reservation = self._build_model(
+            Reservation,
+            {
+                "reservation_id": self._generate_id(
+                    "RES",
+                    self._reservations_entry(),
+                ),
+                "customer_id": customer_id,
+                "hotel_id": hotel_id,
+                "room_count": room_count,
+                "status": STATUS_ACTIVE,
+            },
+        )
+        if reservation is None:
             return None
 
-        customers = self._load_customers()
-        hotels = self._load_hotels()
-        reservations = self._load_reservations()
-
-        customer = next(
-            (
-                current
-                for current in customers
-                if current.customer_id == customer_id
-            ),
-            None,
-        )
-        if customer is None:
+        if customer_id not in self._customers_entry().by_id:
             print(f"ERROR: cliente no encontrado: {customer_id}")
             return None
 
-        hotel = next(
-            (current for current in hotels if current.hotel_id == hotel_id),
-            None,
-        )
+        hotels = self._hotels_entry()
+        hotel = hotels.by_id.get(hotel_id)
         if hotel is None:
             print(f"ERROR: hotel no encontrado: {hotel_id}")
             return None
 
-        if hotel.available_rooms < room_count:
+        if hotel.available_rooms < reservation.room_count:
             print(
                 "ERROR: no hay disponibilidad suficiente para "
                 f"el hotel {hotel_id}"
             )
             return None
 
-        hotel.available_rooms -= room_count
-        reservation = Reservation(
-            reservation_id=self._generate_id("RES"),
-            customer_id=customer_id,
-            hotel_id=hotel_id,
-            room_count=room_count,
-            status="active",
-        )
-
-        validated = Reservation.from_dict(reservation.to_dict())
-        if validated is None:
-            return None
-
-        reservations.append(validated)
-        self._save_hotels(hotels)
-        self._save_reservations(reservations)
-        return validated
+        hotel.available_rooms -= reservation.room_count
+        self._save_hotels(hotels.models)
+        self._append_model(self.reservations_file, reservation)
+        return reservation
 
     def cancel_reservation(self, reservation_id: str) -> bool:
         """Cancela una reservación activa y libera disponibilidad."""
-        hotels = self._load_hotels()
-        reservations = self._load_reservations()
-
-        target: Reservation | None = None
-        for reservation in reservations:
-            if reservation.reservation_id == reservation_id:
-                target = reservation
-                break
-
+        reservations = self._reservations_entry()
+        target = reservations.by_id.get(reservation_id)
         if target is None:
             print(f"ERROR: reservación no encontrada: {reservation_id}")
             return False
 
-        if target.status == "cancelled":
+        if target.status == STATUS_CANCELLED:
             print("ERROR: la reservación ya estaba cancelada")
             return False
 
-        hotel = next(
-            (
-                current
-                for current in hotels
-                if current.hotel_id == target.hotel_id
-            ),
-            None,
-        )
+        hotels = self._hotels_entry()
+        hotel = hotels.by_id.get(target.hotel_id)
         if hotel is None:
             print(
                 "ERROR: hotel asociado no encontrado para "
@@ -355,15 +556,15 @@ class HotelSystem:
             )
             return False
 
-        target.status = "cancelled"
+        target.status = STATUS_CANCELLED
         hotel.available_rooms += target.room_count
         hotel.available_rooms = min(
             hotel.available_rooms,
             hotel.total_rooms,
         )
 
-        self._save_hotels(hotels)
-        self._save_reservations(reservations)
+        self._save_hotels(hotels.models)
+        self._save_reservations(reservations.models)
         return True
 
     def display_reservation_information(
@@ -371,22 +572,17 @@ class HotelSystem:
         reservation_id: str,
     ) -> dict[str, object] | None:
         """Devuelve información de una reservación por identificador."""
-        customers = self._load_customers()
-        customer_lookup = {
-            customer.customer_id: customer.full_name
-            for customer in customers
-        }
+        reservation = self._reservations_entry().by_id.get(reservation_id)
+        if reservation is None:
+            print(f"ERROR: reservación no encontrada: {reservation_id}")
+            return None
 
-        for reservation in self._load_reservations():
-            if reservation.reservation_id == reservation_id:
-                payload = reservation.to_dict()
-                payload["customer_name"] = customer_lookup.get(
-                    reservation.customer_id,
-                    "Cliente no encontrado",
-                )
-                return payload
-        print(f"ERROR: reservación no encontrada: {reservation_id}")
-        return None
+        customer = self._customers_entry().by_id.get(reservation.customer_id)
+        payload = reservation.to_dict()
+        payload["customer_name"] = (
+            "Cliente no encontrado" if customer is None else customer.full_name
+        )
+        return payload
 
     def search_reservations_by_name(
         self,
@@ -402,16 +598,16 @@ class HotelSystem:
         matching_customer_ids = {
             customer.customer_id: customer.full_name
             for customer in customers
-            if normalized_name in customer.full_name.strip().lower()
+            if normalized_name in customer.search_name
         }
         if not matching_customer_ids:
             print(f"ERROR: cliente no encontrado por nombre: {customer_name}")
             return []
 
         results: list[dict[str, object]] = []
-        for reservation in self._load_reservations():
-            if reservation.customer_id not in matching_customer_ids:
-                continue
+        for reservation in self._reservations_by_customer(
+            matching_customer_ids
+        ):
             payload = reservation.to_dict()
             payload["customer_name"] = matching_customer_ids[
                 reservation.customer_id
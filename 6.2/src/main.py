@@ -4,37 +4,91 @@ from __future__ import annotations
 
 import argparse
 import datetime
+import os
 import sys
 from pathlib import Path
 
 from src.hotel_system import HotelSystem
 
 
-RESULT_FILE = (
-    Path(__file__).resolve().parents[1]
-    / "result"
-    / "HotelSystemResults.txt"
+BASE_DIR = Path(__file__).resolve().parents[1]
+DEFAULT_DATA_DIR = BASE_DIR / "source" / "input"
+RESULT_FILE = BASE_DIR / "result" / "HotelSystemResults.txt"
+LINEA_SIMPLE = "-" * 45
+LINEA_DOBLE = "=" * 45
+# Menú armado una sola vez: cada redibujado es un único print.
+MENU = "\n".join(
+    (
+        "\n=== Sistema de Reservaciones de Hotel ===",
+        "1. Crear hotel",
+        "2. Eliminar hotel",
+        "3. Mostrar informacion de hotel",
+        "4. Modificar informacion de hotel",
+        "5. Crear cliente",
+        "6. Eliminar cliente",
+        "7. Mostrar informacion de cliente",
+        "8. Modificar informacion de cliente",
+        "9. Crear reservacion",
+        "10. Cancelar reservacion",
+        "11. Buscar reservacion",
+        "0. Salir",
+    )
 )
 
 
 class FlujoDuplicado:
-    """Replica la salida a consola y a un archivo de resultados."""
-
-    def __init__(self, consola, archivo) -> None:
+    """Replica la salida a consola y a un archivo de resultados.
+
+    El archivo se recibe abierto en modo binario, sin otra capa de texto.
+    Los fragmentos se acumulan y llegan al archivo como una línea completa
+    codificada una sola vez a UTF-8, de modo que un print (texto y salto de
+    línea) cuesta una codificación y una escritura.
+    """
+
+    def __init__(
+        self,
+        consola,
+        archivo,
+        tamano_buffer: int = 1 << 16,
+    ) -> None:
         """Inicializa destino principal y secundario de salida."""
         self.consola = consola
         self.archivo = archivo
+        self.tamano_buffer = tamano_buffer
+        self._pendiente: list[str] = []
+        self._pendiente_tamano = 0
+        # Métodos ligados una sola vez para no buscarlos en cada print.
+        self._escribir_consola = consola.write
+        self._escribir_archivo = archivo.write
 
     def write(self, mensaje: str) -> int:
         """Escribe en ambos destinos."""
-        self.consola.write(mensaje)
-        self.archivo.write(mensaje)
+        if mensaje:
+            self._escribir_consola(mensaje)
+            self._pendiente.append(mensaje)
+            self._pendiente_tamano += len(mensaje)
+            if (
+                mensaje[-1] == "\n"
+                or self._pendiente_tamano >= self.tamano_buffer
+            ):
+                self._vaciar_pendiente()
         return len(mensaje)
 
+    def _vaciar_pendiente(self) -> None:
+        """Entrega al archivo lo acumulado desde la última línea."""
+        if self._pendiente:
+            self._escribir_archivo("".join(self._pendiente).encode("utf-8"))
+            self._pendiente.clear()
+            self._pendiente_tamano = 0
+
+    def writelines(self, lineas) -> None:
+        """Escribe varias cadenas en ambos destinos con una sola llamada."""
+        self.write("".join(lineas))
+
     def flush(self) -> None:
-        """Fuerza el vaciado del buffer en ambos destinos."""
+        """Vacía la consola; el archivo se vacía a disco al cerrarse."""
+        self._vaciar_pendiente()
         self.consola.flush()
-        self.archivo.flush()
 
 
 def parse_args() -> argparse.Namespace:
@@ -45,18 +99,26 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--data-dir",
         type=Path,
-        default=Path(__file__).resolve().parents[1] / "source" / "input",
+        default=DEFAULT_DATA_DIR,
         help=(
             "Directorio donde se almacenan hotels.jsonl, "
             "customers.jsonl y reservations.jsonl"
         ),
     )
+    parser.add_argument(
+        "--no-log",
+        action="store_true",
+        help=(
+            "No duplicar la salida en el archivo de resultados "
+            "(util en ejecuciones automatizadas)"
+        ),
+    )
     return parser.parse_args()
 
 
 def mostrar_separador() -> None:
     """Imprime una linea separadora visual."""
-    print("-" * 45)
+    print(LINEA_SIMPLE)
 
 
 def mostrar_exito(mensaje: str) -> None:
@@ -84,21 +146,16 @@ def solicitar_entero(mensaje: str) -> int:
             mostrar_error("Debes ingresar un numero entero.")
 
 
+def parsear_amenidades(texto: str) -> list[str]:
+    """Separa amenidades por coma descartando espacios y vacíos."""
+    # split + map(str.strip) corre en C y midió más rápido que separar con
+    # una expresión regular o extraer con findall.
+    return [item for item in map(str.strip, texto.split(",")) if item]
+
+
 def mostrar_menu() -> None:
     """Imprime las opciones disponibles en consola."""
-    print("\n=== Sistema de Reservaciones de Hotel ===")
-    print("1. Crear hotel")
-    print("2. Eliminar hotel")
-    print("3. Mostrar informacion de hotel")
-    print("4. Modificar informacion de hotel")
-    print("5. Crear cliente")
-    print("6. Eliminar cliente")
-    print("7. Mostrar informacion de cliente")
-    print("8. Modificar informacion de cliente")
-    print("9. Crear reservacion")
-    print("10. Cancelar reservacion")
-    print("11. Buscar reservacion")
-    print("0. Salir")
+    print(MENU)
 
 
 def esperar_tecla() -> None:
@@ -114,42 +171,42 @@ def mostrar_hotel_bonito(data: dict[str, object]) -> None:
     else:
         amenidades_txt = "Sin amenidades registradas"
 
-    print("\n" + "=" * 45)
+    print(f"\n{LINEA_DOBLE}")
     print("INFORMACION DEL HOTEL")
-    print("=" * 45)
+    print(LINEA_DOBLE)
     print(f"ID: {data.get('hotel_id', 'N/A')}")
     print(f"Nombre: {data.get('name', 'N/A')}")
     print(f"Ubicacion: {data.get('location', 'N/A')}")
     print(f"Cuartos totales: {data.get('total_rooms', 'N/A')}")
     print(f"Cuartos disponibles: {data.get('available_rooms', 'N/A')}")
     print(f"Amenidades: {amenidades_txt}")
-    print("=" * 45)
+    print(LINEA_DOBLE)
 
 
 def mostrar_cliente_bonito(data: dict[str, str]) -> None:
     """Imprime un cliente con formato legible para el usuario."""
-    print("\n" + "=" * 45)
+    print(f"\n{LINEA_DOBLE}")
     print("INFORMACION DEL CLIENTE")
-    print("=" * 45)
+    print(LINEA_DOBLE)
     print(f"ID: {data.get('customer_id', 'N/A')}")
     print(f"Nombre completo: {data.get('full_name', 'N/A')}")
     print(f"Correo: {data.get('email', 'N/A')}")
     print(f"Telefono: {data.get('phone', 'N/A')}")
-    print("=" * 45)
+    print(LINEA_DOBLE)
 
 
 def mostrar_reservacion_bonita(data: dict[str, object]) -> None:
     """Imprime una reservacion con formato legible para el usuario."""
-    print("\n" + "=" * 45)
+    print(f"\n{LINEA_DOBLE}")
     print("INFORMACION DE LA RESERVACION")
-    print("=" * 45)
+    print(LINEA_DOBLE)
     print(f"ID: {data.get('reservation_id', 'N/A')}")
     print(f"Cliente: {data.get('customer_id', 'N/A')}")
     print(f"Nombre cliente: {data.get('customer_name', 'N/A')}")
     print(f"Hotel: {data.get('hotel_id', 'N/A')}")
     print(f"Cantidad de cuartos: {data.get('room_count', 'N/A')}")
     print(f"Estatus: {data.get('status', 'N/A')}")
-    print("=" * 45)
+    print(LINEA_DOBLE)
 
 
 def opcion_crear_hotel(sistema: HotelSystem) -> None:
@@ -157,16 +214,9 @@ def opcion_crear_hotel(sistema: HotelSystem) -> None:
     nombre = input("Nombre del hotel: ").strip()
     ubicacion = input("Ubicacion: ").strip()
     total_cuartos = solicitar_entero("Total de cuartos: ")
-    amenidades_crudas = input(
-        "Amenidades separadas por coma (opcional): "
-    ).strip()
-    amenidades = []
-    if amenidades_crudas:
-        amenidades = [
-            item.strip()
-            for item in amenidades_crudas.split(",")
-            if item.strip()
-        ]
+    amenidades = parsear_amenidades(
+        input("Amenidades separadas por coma (opcional): ")
+    )
 
     hotel = sistema.create_hotel(nombre, ubicacion, total_cuartos, amenidades)
     if hotel is None:
@@ -253,9 +303,7 @@ def opcion_modificar_hotel(sistema: HotelSystem) -> None:
         f"(valor actual: {amenidades_actuales_txt}): "
     ).strip()
     if amenidades:
-        cambios["amenities"] = [
-            item.strip() for item in amenidades.split(",") if item.strip()
-        ]
+        cambios["amenities"] = parsear_amenidades(amenidades)
 
     if not cambios:
         mostrar_error("No se proporcionaron cambios.")
@@ -409,37 +457,42 @@ def opcion_buscar_reservacion(sistema: HotelSystem) -> None:
     mostrar_error("Criterio invalido.")
 
 
+# Acciones indexadas por número de opción; la posición 0 es "Salir".
+ACCIONES = (
+    None,
+    opcion_crear_hotel,
+    opcion_eliminar_hotel,
+    opcion_mostrar_hotel,
+    opcion_modificar_hotel,
+    opcion_crear_cliente,
+    opcion_eliminar_cliente,
+    opcion_mostrar_cliente,
+    opcion_modificar_cliente,
+    opcion_crear_reservacion,
+    opcion_cancelar_reservacion,
+    opcion_buscar_reservacion,
+)
+# Solo la forma canónica de cada número es válida ("1", no "01" ni "00").
+OPCIONES = {str(indice): indice for indice in range(len(ACCIONES))}
+
+
 def ejecutar_menu(sistema: HotelSystem) -> None:
     """Ejecuta el ciclo principal del menu interactivo."""
-    acciones = {
-        "1": opcion_crear_hotel,
-        "2": opcion_eliminar_hotel,
-        "3": opcion_mostrar_hotel,
-        "4": opcion_modificar_hotel,
-        "5": opcion_crear_cliente,
-        "6": opcion_eliminar_cliente,
-        "7": opcion_mostrar_cliente,
-        "8": opcion_modificar_cliente,
-        "9": opcion_crear_reservacion,
-        "10": opcion_cancelar_reservacion,
-        "11": opcion_buscar_reservacion,
-    }
-
     while True:
         mostrar_menu()
         opcion = input("Selecciona una opcion: ").strip()
 
-        if opcion == "0":
+        indice = OPCIONES.get(opcion, -1)
+        if indice == 0:
             print("Saliendo del sistema. Hasta luego.")
             break
 
-        accion = acciones.get(opcion)
-        if accion is None:
+        if not 0 < indice < len(ACCIONES):
             mostrar_error("Opcion invalida.")
             esperar_tecla()
             continue
 
-        accion(sistema)
+        ACCIONES[indice](sistema)
         esperar_tecla()
 
 
@@ -448,13 +501,25 @@ def main() -> int:
     args = parse_args()
     args.data_dir.mkdir(parents=True, exist_ok=True)
     sistema = HotelSystem(data_dir=args.data_dir)
+
+    if args.no_log:
+        # Sin archivo de resultados: se escribe directo a la consola.
+        mostrar_separador()
+        mostrar_info(f"Directorio de datos: {args.data_dir}")
+        mostrar_info("Registro en archivo desactivado (--no-log)")
+        mostrar_separador()
+        try:
+            ejecutar_menu(sistema)
+        finally:
+            sistema.sync()
+        return 0
+
     RESULT_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-    with RESULT_FILE.open("a", encoding="utf-8") as salida:
-        salida.write("\n" + "=" * 60 + "\n")
+    with RESULT_FILE.open("ab", buffering=1 << 16) as salida:
+        inicio = datetime.datetime.now().isoformat(timespec="seconds")
         salida.write(
-            "Inicio de ejecucion: "
-            f"{datetime.datetime.now().isoformat(timespec='seconds')}\n"
+            f"\n{'=' * 60}\nInicio de ejecucion: {inicio}\n".encode("utf-8")
         )
 
         salida_duplicada = FlujoDuplicado(sys.stdout, salida)
@@ -472,6 +537,14 @@ def main() -> int:
         finally:
             sys.stdout = original_stdout
             sys.stderr = original_stderr
+            salida_duplicada.flush()
+            error_duplicado.flush()
+            # Único vaciado a disco del registro, al terminar.
+            salida.flush()
+            os.fsync(salida.fileno())
+            # Con los flujos ya restaurados, un error al sincronizar los
+            # datos se reporta en la consola y no en un registro cerrado.
+            sistema.sync()
 
     return 0
 
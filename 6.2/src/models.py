@@ -2,10 +2,44 @@
 
 from __future__ import annotations
 
+import re
+import sys
 from dataclasses import dataclass, field
+from typing import Iterable
 
+STATUS_ACTIVE = "active"
+STATUS_CANCELLED = "cancelled"
+RESERVATION_STATUSES = frozenset((STATUS_ACTIVE, STATUS_CANCELLED))
+# orjson solo maneja enteros de 64 bits (los mayores los lee como float);
+# con este límite ambas rutas de serialización guardan y leen lo mismo.
+MAX_ROOMS = (1 << 63) - 1
 
-@dataclass
+# Se compila una sola vez al importar el módulo: usuario@dominio.ext.
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+# Con __slots__ cada instancia omite su __dict__ (menos memoria y acceso
+# más directo a atributos). dataclass solo lo soporta desde Python 3.10.
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Identificadores, ubicaciones, amenidades y estatus se repiten mucho entre
+# registros; al internarlos, from_dict comparte un solo objeto por valor y
+# las comparaciones entre ellos resuelven por identidad.
+_STATUS_BY_VALUE = {status: status for status in RESERVATION_STATUSES}
+
+
+def _shared_amenities(values: Iterable[object]) -> list[object]:
+    """Copia las amenidades compartiendo un objeto por cada texto."""
+    return [
+        sys.intern(value) if isinstance(value, str) else value
+        for value in values
+    ]
+
+
+class ValidationError(ValueError):
+    """Indica un registro o modelo que no cumple las reglas del dominio."""
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Hotel:
     """Representa un hotel con capacidad disponible para reservaciones."""
 
@@ -24,38 +58,49 @@ class Hotel:
             "location": self.location,
             "total_rooms": self.total_rooms,
             "available_rooms": self.available_rooms,
-            "amenities": self.amenities,
+            # Copia: el diccionario no debe compartir la lista del modelo.
+            "amenities": list(self.amenities),
         }
 
     @classmethod
-    def from_dict(cls, payload: dict[str, object]) -> Hotel | None:
-        """Construye un hotel desde un diccionario validando sus datos."""
+    def from_dict(cls, payload: dict[str, object]) -> Hotel:
+        """Construye un hotel validado; lanza ValidationError si falla."""
         try:
             hotel = cls(
-                hotel_id=str(payload["hotel_id"]),
+                hotel_id=sys.intern(str(payload["hotel_id"])),
                 name=str(payload["name"]),
-                location=str(payload["location"]),
+                location=sys.intern(str(payload["location"])),
                 total_rooms=int(payload["total_rooms"]),
                 available_rooms=int(payload["available_rooms"]),
-                amenities=list(payload.get("amenities", [])),
+                amenities=_shared_amenities(payload.get("amenities", [])),
             )
         except (KeyError, TypeError, ValueError) as exc:
-            print(f"ERROR: registro de hotel inválido: {exc}")
-            return None
-
-        if hotel.total_rooms < 0 or hotel.available_rooms < 0:
-            print("ERROR: el hotel no puede tener cuartos negativos")
-            return None
-        if hotel.available_rooms > hotel.total_rooms:
-            print(
-                "ERROR: cuartos disponibles no puede ser mayor al total "
-                f"en hotel {hotel.hotel_id}"
-            )
-            return None
+            raise ValidationError(
+                f"registro de hotel inválido: {exc}"
+            ) from exc
+        hotel.check()
         return hotel
 
+    def check(self) -> None:
+        """Verifica las reglas del hotel; lanza ValidationError si falla."""
+        if self.total_rooms < 0 or self.available_rooms < 0:
+            raise ValidationError("el hotel no puede tener cuartos negativos")
+        if self.total_rooms > MAX_ROOMS:
+            raise ValidationError(
+                f"el hotel {self.hotel_id} excede el máximo de cuartos"
+            )
+        if self.available_rooms > self.total_rooms:
+            raise ValidationError(
+                "cuartos disponibles no puede ser mayor al total "
+                f"en hotel {self.hotel_id}"
+            )
 
-@dataclass
+    def validate(self) -> bool:
+        """Verifica las reglas del hotel e informa el error encontrado."""
+        return _report_errors(self)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Customer:
     """Representa un cliente del sistema de hoteles."""
 
@@ -63,6 +108,22 @@ class Customer:
     full_name: str
     email: str
     phone: str
+    # (nombre original, nombre normalizado) para no recalcular búsquedas.
+    _search_name: tuple[str, str] = field(
+        default=("", ""),
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    @property
+    def search_name(self) -> str:
+        """Nombre sin espacios externos y en minúsculas para búsquedas."""
+        source, normalized = self._search_name
+        if source is not self.full_name:
+            normalized = self.full_name.strip().lower()
+            self._search_name = (self.full_name, normalized)
+        return normalized
 
     def to_dict(self) -> dict[str, str]:
         """Convierte la instancia a diccionario serializable."""
@@ -74,29 +135,40 @@ class Customer:
         }
 
     @classmethod
-    def from_dict(cls, payload: dict[str, object]) -> Customer | None:
-        """Construye un cliente desde un diccionario validando sus datos."""
+    def from_dict(cls, payload: dict[str, object]) -> Customer:
+        """Construye un cliente validado; lanza ValidationError si falla."""
         try:
             customer = cls(
-                customer_id=str(payload["customer_id"]),
+                customer_id=sys.intern(str(payload["customer_id"])),
                 full_name=str(payload["full_name"]),
                 email=str(payload["email"]),
                 phone=str(payload["phone"]),
             )
         except (KeyError, TypeError, ValueError) as exc:
-            print(f"ERROR: registro de cliente inválido: {exc}")
-            return None
+            raise ValidationError(
+                f"registro de cliente inválido: {exc}"
+            ) from exc
+        customer.check()
+        return customer
 
-        if "@" not in customer.email or not customer.full_name.strip():
-            print(
-                "ERROR: datos inválidos de cliente "
-                f"{customer.customer_id}"
+    def check(self) -> None:
+        """Verifica las reglas del cliente; lanza ValidationError si falla."""
+        name = self.full_name
+        if (
+            _EMAIL_RE.fullmatch(self.email) is None
+            or not name
+            or name.isspace()
+        ):
+            raise ValidationError(
+                f"datos inválidos de cliente {self.customer_id}"
             )
-            return None
-        return customer
+
+    def validate(self) -> bool:
+        """Verifica las reglas del cliente e informa el error encontrado."""
+        return _report_errors(self)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Reservation:
     """Representa una reservación entre un cliente y un hotel."""
 
@@ -104,7 +176,7 @@ class Reservation:
     customer_id: str
     hotel_id: str
     room_count: int
-    status: str = "active"
+    status: str = STATUS_ACTIVE
 
     def to_dict(self) -> dict[str, object]:
         """Convierte la instancia a diccionario serializable."""
@@ -120,30 +192,48 @@ class Reservation:
     def from_dict(
         cls,
         payload: dict[str, object],
-    ) -> Reservation | None:
-        """Construye una reservación desde un diccionario."""
+    ) -> Reservation:
+        """Construye una reservación validada desde un diccionario."""
         try:
+            status = str(payload.get("status", STATUS_ACTIVE))
             reservation = cls(
                 reservation_id=str(payload["reservation_id"]),
-                customer_id=str(payload["customer_id"]),
-                hotel_id=str(payload["hotel_id"]),
+                customer_id=sys.intern(str(payload["customer_id"])),
+                hotel_id=sys.intern(str(payload["hotel_id"])),
                 room_count=int(payload["room_count"]),
-                status=str(payload.get("status", "active")),
+                # Un estatus conocido queda como la constante del módulo.
+                status=_STATUS_BY_VALUE.get(status, status),
             )
         except (KeyError, TypeError, ValueError) as exc:
-            print(f"ERROR: registro de reservación inválido: {exc}")
-            return None
+            raise ValidationError(
+                f"registro de reservación inválido: {exc}"
+            ) from exc
+        reservation.check()
+        return reservation
 
-        if reservation.room_count <= 0:
-            print(
-                "ERROR: cantidad de cuartos inválida en reservación "
-                f"{reservation.reservation_id}"
+    def check(self) -> None:
+        """Verifica las reglas de la reservación; lanza ValidationError."""
+        if not 0 < self.room_count <= MAX_ROOMS:
+            raise ValidationError(
+                "cantidad de cuartos inválida en reservación "
+                f"{self.reservation_id}"
             )
-            return None
-        if reservation.status not in {"active", "cancelled"}:
-            print(
-                "ERROR: estatus inválido en reservación "
-                f"{reservation.reservation_id}"
+        if self.status not in RESERVATION_STATUSES:
+            raise ValidationError(
+                "estatus inválido en reservación "
+                f"{self.reservation_id}"
             )
-            return None
-        return reservation
+
+    def validate(self) -> bool:
+        """Verifica las reglas de la reservación e informa el error."""
+        return _report_errors(self)
+
+
+def _report_errors(model: Hotel | Customer | Reservation) -> bool:
+    """Ejecuta check() del modelo e imprime el error si lo hay."""
+    try:
+        model.check()
+    except ValidationError as exc:
+        print(f"ERROR: {exc}")
+        return False
+    return True
@@ -3,49 +3,141 @@
 from __future__ import annotations
 
 import json
+import mmap
+import os
 from pathlib import Path
 from typing import Any
+from typing import Iterable
+from typing import Iterator
 
+try:
+    import orjson
+except ImportError:  # Dependencia opcional: se usa json de la stdlib.
+    orjson = None
 
-def load_jsonl(file_path: Path, entity_name: str) -> list[dict[str, Any]]:
-    """Carga registros JSONL y omite líneas inválidas sin detener ejecución."""
-    if not file_path.exists():
-        return []
+_ENCODER = json.JSONEncoder(ensure_ascii=True)
+_DECODER = json.JSONDecoder()
+# orjson.JSONDecodeError hereda de json.JSONDecodeError.
+_DECODE_ERRORS = (json.JSONDecodeError, UnicodeDecodeError)
+_SAVE_CHUNK_BYTES = 1 << 20
+
+if orjson is not None:
+    # orjson lee directo desde la vista en memoria y escribe bytes UTF-8.
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+
+    def _loads(raw_line: memoryview) -> Any:
+        """Decodifica una línea con el decodificador de la stdlib."""
+        # Decodificador reutilizado: evita la detección de codificación y
+        # los chequeos que hace json.loads.
+        return _DECODER.decode(str(raw_line, "utf-8"))
+
+    def _dumps(record: dict[str, Any]) -> bytes:
+        """Serializa un registro; con ensure_ascii la salida es ASCII."""
+        return _ENCODER.encode(record).encode("ascii")
+
+
+def iter_jsonl(
+    file_path: Path,
+    entity_name: str,
+) -> Iterator[dict[str, Any]]:
+    """Recorre registros JSONL y omite líneas inválidas sin detener ejecución.
 
-    records: list[dict[str, Any]] = []
-    with file_path.open("r", encoding="utf-8") as file:
-        for line_number, raw_line in enumerate(file, start=1):
-            line = raw_line.strip()
-            if not line:
-                continue
+    Los registros se entregan uno a uno, sin armar la lista completa.
+    """
+    try:
+        file = file_path.open("rb")
+    except FileNotFoundError:
+        return
 
-            try:
-                payload = json.loads(line)
-            except json.JSONDecodeError as exc:
-                print(
-                    "ERROR: línea inválida en "
-                    f"{entity_name} ({file_path}, línea {line_number}): {exc}"
-                )
-                continue
+    with file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        # El archivo se mapea a memoria y los saltos de línea se buscan con
+        # find. Cada línea se decodifica directo desde una vista del mapa,
+        # sin copiarla ni recortarla: JSON ya ignora los espacios
+        # alrededor del valor.
+        with mmap.mmap(
+            file.fileno(),
+            0,
+            access=mmap.ACCESS_READ,
+        ) as data, memoryview(data) as view:
+            size = len(data)
+            start = 0
+            line_number = 0
+            while start < size:
+                end = data.find(b"\n", start)
+                if end < 0:
+                    end = size
+                line_number += 1
+                line_start, start = start, end + 1
+                if line_start == end:
+                    continue
 
-            if not isinstance(payload, dict):
-                print(
-                    "ERROR: formato inválido en "
-                    f"{entity_name} ({file_path}, línea {line_number})"
-                )
-                continue
+                try:
+                    with view[line_start:end] as raw_line:
+                        payload = _loads(raw_line)
+                except _DECODE_ERRORS as exc:
+                    if data[line_start:end].isspace():
+                        continue
+                    print(
+                        "ERROR: línea inválida en "
+                        f"{entity_name} ({file_path}, línea {line_number}): "
+                        f"{exc}"
+                    )
+                    continue
 
-            records.append(payload)
+                if not isinstance(payload, dict):
+                    print(
+                        "ERROR: formato inválido en "
+                        f"{entity_name} ({file_path}, línea {line_number})"
+                    )
+                    continue
 
-    return records
+                yield payload
+
+
+def load_jsonl(file_path: Path, entity_name: str) -> list[dict[str, Any]]:
+    """Carga registros JSONL y omite líneas inválidas sin detener ejecución."""
+    return list(iter_jsonl(file_path, entity_name))
 
 
 def save_jsonl(
     file_path: Path,
-    records: list[dict[str, Any]],
+    records: Iterable[dict[str, Any]],
 ) -> None:
-    """Guarda una lista de registros como JSONL."""
+    """Guarda registros como JSONL; basta con que sean iterables."""
     file_path.parent.mkdir(parents=True, exist_ok=True)
-    with file_path.open("w", encoding="utf-8") as file:
+    # Las líneas se agrupan en bloques de hasta _SAVE_CHUNK_BYTES: una
+    # escritura por bloque sin armar en memoria el archivo completo.
+    with file_path.open("wb") as file:
+        pending: list[bytes] = []
+        pending_size = 0
         for record in records:
-            file.write(json.dumps(record, ensure_ascii=True) + "\n")
+            line = _dumps(record)
+            pending.append(line)
+            pending_size += len(line) + 1
+            if pending_size >= _SAVE_CHUNK_BYTES:
+                pending.append(b"")
+                file.write(b"\n".join(pending))
+                pending.clear()
+                pending_size = 0
+        if pending:
+            pending.append(b"")
+            file.write(b"\n".join(pending))
+
+
+def append_jsonl(file_path: Path, record: dict[str, Any]) -> None:
+    """Agrega un registro al final del archivo JSONL sin reescribirlo."""
+    # Se serializa antes de abrir: un error no deja el archivo creado.
+    line = _dumps(record)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    with file_path.open("a+b") as file:
+        # Si la última línea quedó sin salto, se separa del nuevo registro.
+        prefix = b""
+        if file.seek(0, 2) > 0:
+            file.seek(-1, 2)
+            if file.read(1) != b"\n":
+                prefix = b"\n"
+        file.write(prefix + line + b"\n")
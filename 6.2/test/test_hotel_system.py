@@ -3,25 +3,30 @@
 from __future__ import annotations
 
 import io
-import shutil
 import tempfile
 import unittest
 from contextlib import redirect_stdout
 from pathlib import Path
+from unittest import mock
 
 from src.hotel_system import HotelSystem
-from src.storage import load_jsonl
+from src.models import MAX_ROOMS
+from src.storage import iter_jsonl, load_jsonl
 
 
 class TestHotelSystem(unittest.TestCase):
     """Valida comportamientos CRUD y de reservaciones."""
 
+    # pylint: disable=too-many-public-methods
+
     def setUp(self) -> None:
         """Crea un directorio temporal por caso de prueba."""
-        temp_path = tempfile.mkdtemp()
-        self.data_dir = Path(temp_path)
+        # Se limpia con addCleanup: debe vivir más allá de setUp.
+        # pylint: disable-next=consider-using-with
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.data_dir = Path(temp_dir.name)
         self.system = HotelSystem(data_dir=self.data_dir)
-        self.addCleanup(shutil.rmtree, self.data_dir)
 
     def test_create_and_display_hotel(self) -> None:
         """Crea un hotel y recupera su información."""
@@ -39,6 +44,75 @@ class TestHotelSystem(unittest.TestCase):
         self.assertEqual(payload["name"], "Hotel Centro")
         self.assertEqual(payload["available_rooms"], 20)
 
+    def test_display_returns_copy(self) -> None:
+        """Cambiar lo mostrado no altera los datos guardados."""
+        hotel = self.system.create_hotel(
+            name="Hotel Copia",
+            location="Puebla",
+            total_rooms=4,
+            amenities=["wifi"],
+        )
+        customer = self.system.create_customer(
+            full_name="Elena Soto",
+            email="elena@example.com",
+            phone="8111111111",
+        )
+        assert hotel is not None
+        assert customer is not None
+
+        shown = self.system.display_hotel_information(hotel.hotel_id)
+        assert shown is not None
+        shown["amenities"].append("pool")
+        self.system.reserve_room(hotel.hotel_id, customer.customer_id)
+
+        shown_again = self.system.display_hotel_information(hotel.hotel_id)
+        assert shown_again is not None
+        self.assertEqual(shown_again["amenities"], ["wifi"])
+        rows = load_jsonl(self.system.hotels_file, "hoteles")
+        self.assertEqual(rows[0]["amenities"], ["wifi"])
+
+    def test_created_model_detached(self) -> None:
+        """Cambiar el modelo creado no altera la caché ni el archivo."""
+        first = self.system.create_hotel(
+            name="Hotel Uno",
+            location="Tepic",
+            total_rooms=5,
+        )
+        assert first is not None
+        self.system.display_hotel_information(first.hotel_id)
+
+        second = self.system.create_hotel(
+            name="Hotel Dos",
+            location="Tepic",
+            total_rooms=5,
+            amenities=["wifi"],
+        )
+        assert second is not None
+        second.available_rooms = 999
+        second.amenities.append("pool")
+
+        shown = self.system.display_hotel_information(second.hotel_id)
+        assert shown is not None
+        self.assertEqual(shown["available_rooms"], 5)
+        self.assertEqual(shown["amenities"], ["wifi"])
+
+    def test_new_ids_skip_stored(self) -> None:
+        """Una corrida con la misma base no repite ids ya guardados."""
+        seed = b"\x00\x00\x00\x07"
+        with mock.patch("src.hotel_system.os.urandom", return_value=seed):
+            first_run = HotelSystem(data_dir=self.data_dir)
+            second_run = HotelSystem(data_dir=self.data_dir)
+        first = first_run.create_hotel("Uno", "Leon", 2)
+        second = second_run.create_hotel("Dos", "Leon", 2)
+        assert first is not None
+        assert second is not None
+
+        self.assertEqual(first.hotel_id, "HOT-00000007")
+        self.assertNotEqual(second.hotel_id, first.hotel_id)
+        shown = second_run.display_hotel_information(second.hotel_id)
+        assert shown is not None
+        self.assertEqual(shown["name"], "Dos")
+
     def test_modify_hotel_information(self) -> None:
         """Modifica datos de un hotel existente."""
         hotel = self.system.create_hotel(
@@ -202,6 +276,33 @@ class TestHotelSystem(unittest.TestCase):
         deleted = self.system.delete_customer(customer.customer_id)
         self.assertFalse(deleted)
 
+    def test_delete_after_cancel(self) -> None:
+        """Permite borrar hotel y cliente tras cancelar su reservación."""
+        hotel = self.system.create_hotel(
+            name="Hotel Libre",
+            location="Celaya",
+            total_rooms=3,
+        )
+        customer = self.system.create_customer(
+            full_name="Rosa Vega",
+            email="rosa@example.com",
+            phone="8777777777",
+        )
+        assert hotel is not None
+        assert customer is not None
+        reservation = self.system.create_reservation(
+            customer.customer_id,
+            hotel.hotel_id,
+        )
+        assert reservation is not None
+
+        with redirect_stdout(io.StringIO()):
+            self.assertFalse(self.system.delete_hotel(hotel.hotel_id))
+        self.system.cancel_reservation(reservation.reservation_id)
+
+        self.assertTrue(self.system.delete_hotel(hotel.hotel_id))
+        self.assertTrue(self.system.delete_customer(customer.customer_id))
+
     def test_invalid_file_lines_ignored(self) -> None:
         """Reporta líneas inválidas y sigue procesando otras válidas."""
         bad_file = self.data_dir / "hotels.jsonl"
@@ -220,6 +321,69 @@ class TestHotelSystem(unittest.TestCase):
         self.assertEqual(len(rows), 1)
         self.assertIn("ERROR:", output.getvalue())
 
+    def test_invalid_models_reported(self) -> None:
+        """Reporta juntos los registros que no pasan la validación."""
+        self.system.hotels_file.write_text(
+            "{\"hotel_id\":\"ok\",\"name\":\"Uno\",\"location\":\"X\","
+            "\"total_rooms\":2,\"available_rooms\":2,\"amenities\":[]}\n"
+            "{\"hotel_id\":\"h2\",\"name\":\"Dos\",\"location\":\"X\","
+            "\"total_rooms\":1,\"available_rooms\":5,\"amenities\":[]}\n"
+            "{\"hotel_id\":\"h3\"}\n",
+            encoding="utf-8",
+        )
+
+        with mock.patch("builtins.print") as printer:
+            shown = self.system.display_hotel_information("ok")
+
+        self.assertIsNotNone(shown)
+        printer.assert_called_once()
+        report = printer.call_args.args[0]
+        self.assertIn("en hotel h2", report)
+        self.assertIn("registro de hotel inválido", report)
+        with redirect_stdout(io.StringIO()):
+            self.assertIsNone(self.system.display_hotel_information("h2"))
+
+    def test_create_appends_line(self) -> None:
+        """Agrega registros aunque el archivo no termine en salto."""
+        self.system.hotels_file.write_text(
+            "{\"hotel_id\":\"h1\",\"name\":\"Uno\",\"location\":\"Y\","
+            "\"total_rooms\":3,\"available_rooms\":3,\"amenities\":[]}",
+            encoding="utf-8",
+        )
+
+        created = self.system.create_hotel(
+            name="Hotel Nuevo",
+            location="Merida",
+            total_rooms=2,
+        )
+        assert created is not None
+
+        rows = load_jsonl(self.system.hotels_file, "hoteles")
+        self.assertEqual(
+            [row["hotel_id"] for row in rows],
+            ["h1", created.hotel_id],
+        )
+        self.assertIsNotNone(self.system.display_hotel_information("h1"))
+
+    def test_create_keeps_prior_bytes(self) -> None:
+        """Crear un cliente no reescribe los registros existentes."""
+        original = (
+            '{ "customer_id": "c1", "full_name": "Uno",'
+            ' "email": "uno@example.com", "phone": "1" }\n'
+        )
+        self.system.customers_file.write_text(original, encoding="utf-8")
+
+        created = self.system.create_customer(
+            full_name="Dos",
+            email="dos@example.com",
+            phone="2",
+        )
+        assert created is not None
+
+        content = self.system.customers_file.read_text(encoding="utf-8")
+        self.assertTrue(content.startswith(original))
+        self.assertEqual(content.count("\n"), 2)
+
     def test_invalid_entities_skipped(self) -> None:
         """Ignora entidades inválidas al cargar modelos desde archivo."""
         self.system.hotels_file.write_text(
@@ -276,6 +440,46 @@ class TestHotelSystem(unittest.TestCase):
         )
         self.assertIsNone(customer)
 
+    def test_rejects_huge_room_count(self) -> None:
+        """Rechaza cuartos fuera del rango de enteros de 64 bits."""
+        with redirect_stdout(io.StringIO()):
+            hotel = self.system.create_hotel("A", "B", MAX_ROOMS + 1)
+        self.assertIsNone(hotel)
+        self.assertFalse(self.system.hotels_file.exists())
+
+        hotel = self.system.create_hotel("A", "B", MAX_ROOMS)
+        assert hotel is not None
+        reloaded = HotelSystem(data_dir=self.data_dir)
+        shown = reloaded.display_hotel_information(hotel.hotel_id)
+        assert shown is not None
+        self.assertEqual(shown["total_rooms"], MAX_ROOMS)
+
+    def test_create_coerces_values(self) -> None:
+        """Convierte cuartos en texto o float y rechaza lo inválido."""
+        from_text = self.system.create_hotel("A", "B", "5")
+        from_float = self.system.create_hotel("C", "D", 5.0)
+        assert from_text is not None
+        assert from_float is not None
+        self.assertEqual(from_text.total_rooms, 5)
+        rows = load_jsonl(self.system.hotels_file, "hoteles")
+        self.assertEqual([row["total_rooms"] for row in rows], [5, 5])
+        self.assertIsInstance(rows[1]["total_rooms"], int)
+
+        with redirect_stdout(io.StringIO()) as output:
+            self.assertIsNone(self.system.create_hotel("E", "F", "abc"))
+            self.assertIsNone(self.system.create_customer("N", None, "1"))
+        self.assertIn("ERROR:", output.getvalue())
+
+    def test_email_requires_domain(self) -> None:
+        """Rechaza correos sin dominio completo o con espacios."""
+        for email in ("ana@", "ana@example", "ana @example.com"):
+            customer = self.system.create_customer(
+                full_name="Ana Dominio",
+                email=email,
+                phone="8888888888",
+            )
+            self.assertIsNone(customer, email)
+
     def test_display_reservation_info(self) -> None:
         """Recupera una reservación por su identificador."""
         hotel = self.system.create_hotel(
@@ -336,6 +540,175 @@ class TestHotelSystem(unittest.TestCase):
         )
         self.assertEqual(matches[0]["customer_name"], "Roberto Martinez")
 
+    def test_cache_reload_external(self) -> None:
+        """Recarga el archivo cuando cambia fuera del sistema."""
+        hotel = self.system.create_hotel(
+            name="Hotel Cache",
+            location="Oaxaca",
+            total_rooms=3,
+        )
+        assert hotel is not None
+        hotels = self.system._load_hotels()  # pylint: disable=protected-access
+        self.assertEqual(len(hotels), 1)
+
+        self.system.hotels_file.write_text("", encoding="utf-8")
+        self.assertIsNone(
+            self.system.display_hotel_information(hotel.hotel_id)
+        )
+
+    def test_modify_reads_file_once(self) -> None:
+        """Consultar y luego modificar no vuelve a leer el archivo."""
+        hotel = self.system.create_hotel(
+            name="Hotel Lectura",
+            location="Tlaxcala",
+            total_rooms=4,
+        )
+        assert hotel is not None
+        self.system.hotels_file.write_text(
+            self.system.hotels_file.read_text(encoding="utf-8") + "\n",
+            encoding="utf-8",
+        )
+
+        with mock.patch(
+            "src.hotel_system.iter_jsonl",
+            wraps=iter_jsonl,
+        ) as loader:
+            self.system.display_hotel_information(hotel.hotel_id)
+            self.system.modify_hotel_information(hotel.hotel_id, name="Otro")
+            self.system.display_hotel_information(hotel.hotel_id)
+
+        self.assertEqual(loader.call_count, 1)
+
+    def test_sync_written_files(self) -> None:
+        """Sincroniza una vez cada archivo escrito y luego nada más."""
+        hotel = self.system.create_hotel(
+            name="Hotel Disco",
+            location="Durango",
+            total_rooms=2,
+        )
+        assert hotel is not None
+        self.system.modify_hotel_information(hotel.hotel_id, name="Otro")
+
+        with mock.patch("src.hotel_system.os.fsync") as fsync:
+            self.system.sync()
+            self.system.sync()
+
+        fsync.assert_called_once()
+
+    def test_failed_modify_not_kept(self) -> None:
+        """Un cambio inválido no queda en memoria ni en archivo."""
+        hotel = self.system.create_hotel(
+            name="Hotel Valida",
+            location="Colima",
+            total_rooms=5,
+        )
+        assert hotel is not None
+
+        changed = self.system.modify_hotel_information(
+            hotel.hotel_id,
+            available_rooms=9,
+        )
+        self.assertFalse(changed)
+        payload = self.system.display_hotel_information(hotel.hotel_id)
+        assert payload is not None
+        self.assertEqual(payload["available_rooms"], 5)
+
+    def test_bad_modify_leaves_cache(self) -> None:
+        """Un valor no convertible no deja cambios a medias en caché."""
+        hotel = self.system.create_hotel(
+            name="Hotel Original",
+            location="Colima",
+            total_rooms=5,
+        )
+        customer = self.system.create_customer(
+            full_name="Ana Ruiz",
+            email="ana@example.com",
+            phone="5550001111",
+        )
+        assert hotel is not None
+        assert customer is not None
+
+        with redirect_stdout(io.StringIO()):
+            changed = self.system.modify_hotel_information(
+                hotel.hotel_id,
+                name="CHANGED",
+                total_rooms="abc",
+            )
+        self.assertFalse(changed)
+        self.system.create_reservation(customer.customer_id, hotel.hotel_id)
+
+        rows = load_jsonl(self.system.hotels_file, "hoteles")
+        self.assertEqual(rows[0]["name"], "Hotel Original")
+        self.assertEqual(rows[0]["available_rooms"], 4)
+
+    def test_search_after_rename(self) -> None:
+        """La búsqueda usa el nombre vigente tras modificar al cliente."""
+        hotel = self.system.create_hotel(
+            name="Hotel Nombre",
+            location="Tepic",
+            total_rooms=2,
+        )
+        customer = self.system.create_customer(
+            full_name="Luis Soto",
+            email="luis@example.com",
+            phone="5550001111",
+        )
+        assert hotel is not None
+        assert customer is not None
+        self.system.create_reservation(customer.customer_id, hotel.hotel_id)
+        matches = self.system.search_reservations_by_name("luis")
+        self.assertEqual(len(matches), 1)
+
+        self.system.modify_customer_information(
+            customer.customer_id,
+            full_name="Pedro Soto",
+        )
+        self.assertEqual(
+            len(self.system.search_reservations_by_name("PEDRO")),
+            1,
+        )
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(
+                self.system.search_reservations_by_name("luis"),
+                [],
+            )
+
+    def test_search_keeps_file_order(self) -> None:
+        """Las coincidencias de varios clientes respetan el orden."""
+        hotel = self.system.create_hotel(
+            name="Hotel Orden",
+            location="Puebla",
+            total_rooms=5,
+        )
+        first = self.system.create_customer(
+            full_name="Ana Lopez",
+            email="ana@example.com",
+            phone="5551112222",
+        )
+        second = self.system.create_customer(
+            full_name="Ana Ruiz",
+            email="ruiz@example.com",
+            phone="5553334444",
+        )
+        assert hotel is not None
+        assert first is not None
+        assert second is not None
+
+        expected = []
+        for customer in (second, first, second):
+            reservation = self.system.create_reservation(
+                customer.customer_id,
+                hotel.hotel_id,
+            )
+            assert reservation is not None
+            expected.append(reservation.reservation_id)
+
+        matches = self.system.search_reservations_by_name("ana")
+        self.assertEqual(
+            [match["reservation_id"] for match in matches],
+            expected,
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,97 @@
+"""Pruebas unitarias del menú y de su salida duplicada."""
+
+from __future__ import annotations
+
+import io
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from src.main import FlujoDuplicado, ejecutar_menu
+
+
+class TestFlujoDuplicado(unittest.TestCase):
+    """Valida la réplica de salida a consola y archivo."""
+
+    def setUp(self) -> None:
+        """Crea consola y archivo en memoria para cada caso."""
+        self.consola = io.StringIO()
+        self.archivo = io.BytesIO()
+        self.flujo = FlujoDuplicado(self.consola, self.archivo)
+
+    def test_partial_line_waits(self) -> None:
+        """Una línea parcial llega al archivo hasta completarse."""
+        self.flujo.write("Hola ")
+        self.assertEqual(self.consola.getvalue(), "Hola ")
+        self.assertEqual(self.archivo.getvalue(), b"")
+
+        self.flujo.write("mundo\n")
+        self.assertEqual(self.consola.getvalue(), "Hola mundo\n")
+        self.assertEqual(self.archivo.getvalue(), b"Hola mundo\n")
+
+    def test_non_ascii_line(self) -> None:
+        """Codifica la línea completa a UTF-8 una sola vez."""
+        with mock.patch.object(
+            self.archivo,
+            "write",
+            wraps=self.archivo.write,
+        ) as escribir:
+            self.flujo = FlujoDuplicado(self.consola, self.archivo)
+            self.flujo.write("Año ")
+            self.flujo.write("ñandú\n")
+
+        escribir.assert_called_once_with("Año ñandú\n".encode("utf-8"))
+        self.assertEqual(self.consola.getvalue(), "Año ñandú\n")
+
+    def test_buffer_threshold(self) -> None:
+        """Vacía al archivo al alcanzar el tamaño de buffer sin salto."""
+        flujo = FlujoDuplicado(self.consola, self.archivo, tamano_buffer=8)
+        flujo.write("1234")
+        self.assertEqual(self.archivo.getvalue(), b"")
+        flujo.write("5678")
+        self.assertEqual(self.archivo.getvalue(), b"12345678")
+
+    def test_flush_drains_pending(self) -> None:
+        """flush entrega lo pendiente y deja el buffer vacío."""
+        self.flujo.write("parcial")
+        self.flujo.flush()
+        self.assertEqual(self.archivo.getvalue(), b"parcial")
+
+        self.flujo.write("x\n")
+        self.assertEqual(self.archivo.getvalue(), b"parcialx\n")
+
+    def test_input_prompt_logged(self) -> None:
+        """El prompt de input queda en el archivo sin esperar salto."""
+        with mock.patch("sys.stdin", io.StringIO("respuesta\n")):
+            with redirect_stdout(self.flujo):
+                valor = input("Nombre: ")
+
+        self.assertEqual(valor, "respuesta")
+        self.assertEqual(self.consola.getvalue(), "Nombre: ")
+        self.assertEqual(self.archivo.getvalue(), b"Nombre: ")
+
+    def test_writelines(self) -> None:
+        """writelines escribe todas las cadenas como un solo bloque."""
+        self.flujo.writelines(["uno\n", "dos\n"])
+        self.assertEqual(self.consola.getvalue(), "uno\ndos\n")
+        self.assertEqual(self.archivo.getvalue(), b"uno\ndos\n")
+
+
+class TestEjecutarMenu(unittest.TestCase):
+    """Valida la selección de opciones del menú."""
+
+    def test_non_canonical_option(self) -> None:
+        """Una opción como "00" es inválida y no termina el programa."""
+        sistema = mock.Mock()
+        entradas = ["00", "", "01", "", "0"]
+        with mock.patch("builtins.input", side_effect=entradas) as leer:
+            with redirect_stdout(io.StringIO()) as salida:
+                ejecutar_menu(sistema)
+
+        self.assertEqual(leer.call_count, len(entradas))
+        self.assertEqual(salida.getvalue().count("Opcion invalida."), 2)
+        self.assertEqual(sistema.mock_calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()